@@ -9,6 +9,7 @@ vargula - Simple cross-platform terminal text styling library with advanced colo
 from .vargula import (
     # Main class
     Vargula,
+    NullVargula,
     
     # Type definitions
     PaletteScheme,
@@ -18,6 +19,7 @@ from .vargula import (
     COLORS,
     BG_COLORS,
     LOOKS,
+    COLOR_DEPTHS,
     
     # Metadata
     __version__,
@@ -33,6 +35,7 @@ __url__ = "https://github.com/crystallinecore/vargula"
 __all__ = [
     # Main class
     "Vargula",
+    "NullVargula",
     
     # Type definitions
     "PaletteScheme",
@@ -42,6 +45,7 @@ __all__ = [
     "COLORS",
     "BG_COLORS",
     "LOOKS",
+    "COLOR_DEPTHS",
     
     # Helper function
     "progress_bar",
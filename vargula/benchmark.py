@@ -351,6 +351,874 @@ def benchmark_real_world():
     print()
 
 
+def benchmark_markup_scaling():
+    """Benchmark format() scaling on large and malformed inputs"""
+    print("=" * 70)
+    print("11. MARKUP SCALING BENCHMARK (input size doubling)")
+    print("=" * 70)
+    print("(Linear parsing keeps the time ratio between rows close to 2x)")
+    print()
+    
+    import vargula 
+    vg = vargula.Vargula(enabled=True)
+    
+    cases = {
+        "flat tags": "<red>a</red> ",
+        "unclosed tags": "<red>x",
+        "bare '<'": "a < b ",
+        "escapes": "\\<red>x\\> ",
+    }
+    sizes = [1000, 2000, 4000, 8000, 16000]
+    
+    for name, unit in cases.items():
+        previous = None
+        print(f"{name}:")
+        for n in sizes:
+            text = unit * n
+            elapsed = measure_time(lambda: vg.format(text), 3)
+            ratio = f"  ({elapsed / previous:4.2f}x)" if previous else ""
+            print(f"  {len(text):>8,} chars: {elapsed:9.3f}ms{ratio}")
+            previous = elapsed
+    print()
+
+
+def benchmark_compiled_templates():
+    """Benchmark compiled templates against format() on the logging scenario"""
+    print("=" * 70)
+    print("12. COMPILED TEMPLATE BENCHMARK (10,000 iterations)")
+    print("=" * 70)
+    print("(Logging lines with variable fields, as in the real-world scenario)")
+    print()
+    
+    import vargula 
+    vg = vargula.Vargula(enabled=True)
+    iterations = 10000
+    
+    messages = [f"Database connection {i} failed" for i in range(iterations)]
+    
+    def vg_format_logging(i):
+        return vg.format(
+            f"<dim>2024-11-22 10:30:{i % 60:02d}</dim> <@red><bold>ERROR</bold></@red> "
+            f"<red>{messages[i]}</red> <cyan>host:</cyan> localhost <cyan>port:</cyan> {5000 + i}"
+        )
+    
+    template = vg.compile(
+        "<dim>2024-11-22 10:30:{sec:02d}</dim> <@red><bold>ERROR</bold></@red> "
+        "<red>{msg}</red> <cyan>host:</cyan> localhost <cyan>port:</cyan> {port}"
+    )
+    
+    def vg_template_logging(i):
+        return template(sec=i % 60, msg=messages[i], port=5000 + i)
+    
+    assert vg_format_logging(7) == vg_template_logging(7)
+    
+    start = time.perf_counter()
+    for i in range(iterations):
+        vg_format_logging(i)
+    format_time = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    for i in range(iterations):
+        vg_template_logging(i)
+    template_time = (time.perf_counter() - start) * 1000
+    
+    print(f"format():   {format_time:8.3f}ms")
+    print(f"compile():  {template_time:8.3f}ms  ({format_time/template_time:5.1f}x faster)")
+    print()
+
+
+def benchmark_instance_creation():
+    """Benchmark Vargula() construction cost"""
+    print("=" * 70)
+    print("13. INSTANCE CREATION BENCHMARK (100,000 iterations)")
+    print("=" * 70)
+    print("(Per-request instances, e.g. one per tenant in a web worker)")
+    print()
+    
+    import vargula 
+    iterations = 100000
+    
+    def per_tenant():
+        vg = vargula.Vargula(enabled=True)
+        vg.create("brand", color="#3498db", look="bold")
+        return vg.format("<brand>tenant</brand>")
+    
+    auto_time = measure_time(lambda: vargula.Vargula(), iterations) * 1000
+    explicit_time = measure_time(lambda: vargula.Vargula(enabled=True), iterations) * 1000
+    tenant_time = measure_time(per_tenant, iterations // 10) * 1000
+    
+    print(f"Vargula():                     {auto_time:7.2f}µs")
+    print(f"Vargula(enabled=True):         {explicit_time:7.2f}µs")
+    print(f"  + create() + format():       {tenant_time:7.2f}µs")
+    print()
+
+
+def benchmark_delta_sgr():
+    """Benchmark output size and speed of delta SGR emission"""
+    print("=" * 70)
+    print("14. DELTA SGR OUTPUT BENCHMARK (5,000 iterations)")
+    print("=" * 70)
+    
+    import vargula 
+    full = vargula.Vargula(enabled=True, format_cache_size=0)
+    delta = vargula.Vargula(enabled=True, format_cache_size=0, delta_sgr=True)
+    iterations = 5000
+    
+    lines = {
+        "log line": "<dim>10:30:45</dim> <@red><bold>ERROR</bold></@red> <red>failed</red> <cyan>host:</cyan> db",
+        "nested": "<bold><red>Error: <italic>critical</italic> failure in <underline>module</underline></red></bold>",
+        "deep": "<bold><#FF5733><@#1a1a1a><italic>a<underline>b<dim>c</dim></underline></italic></@#1a1a1a></#FF5733></bold>",
+    }
+    
+    for name, markup in lines.items():
+        plain = len(full.strip(markup))
+        full_bytes = len(full.format(markup))
+        delta_bytes = len(delta.format(markup))
+        full_time = measure_time(lambda: full.format(markup), iterations)
+        delta_time = measure_time(lambda: delta.format(markup), iterations)
+        print(f"{name}: text {plain} chars")
+        print(f"  full:   {full_bytes:4d} chars  {full_time:7.3f}ms")
+        print(f"  delta:  {delta_bytes:4d} chars  {delta_time:7.3f}ms  ({full_bytes/delta_bytes:4.2f}x smaller)")
+    print()
+
+
+def benchmark_console_writes():
+    """Benchmark write syscalls of Vargula.write() against a buffered Console"""
+    print("=" * 70)
+    print("15. BUFFERED CONSOLE BENCHMARK (100,000 lines)")
+    print("=" * 70)
+    
+    import os
+    import tempfile
+    import threading
+    import vargula 
+    vg = vargula.Vargula(enabled=True)
+    lines = 100000
+    markup = "<green>ok</green> request served in <cyan>12ms</cyan>"
+    
+    class SyscallCounter:
+        """Unbuffered text stream: every write() is one os.write() call."""
+        def __init__(self, fd):
+            self.fd = fd
+            self.calls = 0
+        def write(self, text):
+            self.calls += 1
+            return os.write(self.fd, text.encode())
+        def flush(self):
+            pass
+    
+    def run(fd):
+        results = {}
+        
+        out = SyscallCounter(fd)
+        start = time.perf_counter()
+        for _ in range(lines):
+            vg.write(markup, file=out)
+        results["vg.write()"] = (time.perf_counter() - start) * 1000, out.calls
+        
+        out = SyscallCounter(fd)
+        start = time.perf_counter()
+        with vg.Console(file=out) as console:
+            for _ in range(lines):
+                console.write(markup)
+        results["Console.write()"] = (time.perf_counter() - start) * 1000, out.calls
+        
+        out = SyscallCounter(fd)
+        start = time.perf_counter()
+        with vg.Console(file=out) as console:
+            console.writelines(markup for _ in range(lines))
+        results["Console.writelines()"] = (time.perf_counter() - start) * 1000, out.calls
+        
+        for name, (elapsed, calls) in results.items():
+            print(f"  {name:22s} {elapsed:9.2f}ms  {calls:7,} write syscalls")
+    
+    read_fd, write_fd = os.pipe()
+    drainer = threading.Thread(target=lambda: [None for _ in iter(lambda: os.read(read_fd, 1 << 16), b"")])
+    drainer.start()
+    print("pipe:")
+    run(write_fd)
+    os.close(write_fd)
+    drainer.join()
+    os.close(read_fd)
+    
+    with tempfile.TemporaryFile() as f:
+        print("file:")
+        run(f.fileno())
+    print()
+
+
+def benchmark_async_console():
+    """Benchmark event-loop latency under heavy log output"""
+    print("=" * 70)
+    print("16. ASYNC CONSOLE BENCHMARK (event-loop latency, 50,000 lines)")
+    print("=" * 70)
+    print("(A ticker measures how late a 1ms asyncio.sleep wakes up while a")
+    print(" coroutine logs into a pipe drained by a slow reader)")
+    print()
+    
+    import asyncio
+    import os
+    import threading
+    import vargula 
+    vg = vargula.Vargula(enabled=True)
+    lines = 50000
+    markup = "<dim>10:30:45</dim> <green>INFO</green> request served in <cyan>12ms</cyan>"
+    
+    def slow_reader(fd):
+        while True:
+            chunk = os.read(fd, 1 << 14)
+            if not chunk:
+                break
+            time.sleep(0.0005)
+    
+    async def ticker(lags, stop):
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append((time.perf_counter() - start - 0.001) * 1000)
+    
+    async def run(use_console):
+        read_fd, write_fd = os.pipe()
+        reader = threading.Thread(target=slow_reader, args=(read_fd,))
+        reader.start()
+        pipe = os.fdopen(write_fd, "w", buffering=1 << 16)
+        lags, stop = [], asyncio.Event()
+        tick = asyncio.get_running_loop().create_task(ticker(lags, stop))
+        start = time.perf_counter()
+        
+        if use_console:
+            loop = asyncio.get_running_loop()
+            transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, pipe)
+            writer = asyncio.StreamWriter(transport, protocol, None, loop)
+            async with vg.AsyncConsole(writer) as console:
+                for i in range(lines):
+                    await console.awrite(markup)
+                    if i % 100 == 0:
+                        await asyncio.sleep(0)
+            transport.close()
+        else:
+            for i in range(lines):
+                vg.write(markup, file=pipe)
+                if i % 100 == 0:
+                    await asyncio.sleep(0)
+            pipe.close()
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        stop.set()
+        await tick
+        reader.join()
+        os.close(read_fd)
+        lags.sort()
+        p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+        worst = lags[-1] if lags else 0.0
+        return elapsed, p99, worst
+    
+    for name, use_console in (("vg.write()", False), ("AsyncConsole", True)):
+        elapsed, p99, worst = asyncio.run(run(use_console))
+        print(f"{name:14s} total {elapsed:8.1f}ms   loop lag p99 {p99:6.2f}ms  max {worst:6.2f}ms")
+    print()
+
+
+def benchmark_shared_instance_threads():
+    """Benchmark one shared instance across threads while themes change"""
+    print("=" * 70)
+    print("17. SHARED INSTANCE THREAD BENCHMARK (format() while set_theme() runs)")
+    print("=" * 70)
+    print("(Worker threads format the same line while an admin thread swaps")
+    print(" themes; every result must be fully theme A or fully theme B)")
+    print()
+    
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    theme_a = {"level": {"color": "green"}, "path": {"color": "cyan"}, "ms": {"color": "yellow", "look": "bold"}}
+    theme_b = {"level": {"color": "red"}, "path": {"color": "magenta"}, "ms": {"color": "blue", "look": "underline"}}
+    markup = "<level>INFO</level> GET <path>/api/users</path> in <ms>12ms</ms>"
+    vg.set_theme(theme_a)
+    expected_a = vg.format(markup)
+    vg.set_theme(theme_b)
+    expected_b = vg.format(markup)
+    valid = {expected_a, expected_b}
+    calls = 200000
+    
+    def worker(n):
+        fmt = vg.format
+        bad = 0
+        for _ in range(n):
+            if fmt(markup) not in valid:
+                bad += 1
+        return bad
+    
+    def admin(stop, swaps):
+        while not stop.is_set():
+            vg.set_theme(theme_a if swaps[0] % 2 else theme_b)
+            swaps[0] += 1
+            time.sleep(0.0005)
+    
+    for threads in (1, 2, 4, 8):
+        stop, swaps = threading.Event(), [0]
+        admin_thread = threading.Thread(target=admin, args=(stop, swaps))
+        admin_thread.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            bad = sum(pool.map(worker, [calls // threads] * threads))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        admin_thread.join()
+        rate = calls / elapsed / 1000
+        print(f"{threads} thread(s): {rate:8.1f}k format/s  theme swaps {swaps[0]:5d}  torn results {bad}")
+    print()
+
+
+def benchmark_color_depth():
+    """Benchmark hex styling and output size at each color depth"""
+    print("=" * 70)
+    print("18. COLOR DEPTH BENCHMARK (5,000 distinct colors)")
+    print("=" * 70)
+    
+    import random
+    import vargula
+    rng = random.Random(7)
+    colors = [f"#{rng.randrange(1 << 24):06x}" for _ in range(5000)]
+    
+    for depth, label in ((24, "truecolor"), (8, "256-color"), (4, "16-color")):
+        vg = vargula.Vargula(enabled=True, color_depth=depth)
+        
+        def run():
+            vargula.Vargula.clear_sgr_cache()
+            return [vg.style("x", color=c, bg=c) for c in colors]
+        
+        run()
+        elapsed = measure_time(run, 5)
+        size = sum(len(line) for line in run()) / len(colors)
+        print(f"{label:10s} {elapsed:8.3f}ms per 5k (uncached)  {size:5.1f} bytes/span")
+    print()
+
+
+def benchmark_visible_length():
+    """Benchmark visible-length measurement of styled text"""
+    print("=" * 70)
+    print("19. VISIBLE LENGTH BENCHMARK")
+    print("=" * 70)
+    print("(Regex strip + len() per call vs the precompiled length() routine)")
+    print()
+    
+    import re
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    
+    def strip_length(text):
+        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+        return len(ansi_escape.sub('', text))
+    
+    cell = vg.format("<green>OK</green>")
+    plain_cell = "web-01"
+    line = vg.format("<dim>ts</dim> <cyan>path</cyan> value " * 300)[:10240]
+    cases = (
+        ("styled cell", cell, 100000),
+        ("plain cell", plain_cell, 100000),
+        ("10KB line", line, 2000),
+    )
+    
+    for name, text, iterations in cases:
+        strip_time = measure_time(lambda: strip_length(text), iterations)
+        length_time = measure_time(lambda: vg.length(text), iterations)
+        print(f"{name:12s} strip+len {strip_time * 1000:9.3f}µs   length() {length_time * 1000:9.3f}µs"
+              f"  ({strip_time / length_time:5.1f}x)")
+    print()
+
+
+def benchmark_cell_width():
+    """Benchmark terminal cell width of ASCII, CJK and emoji text"""
+    print("=" * 70)
+    print("20. CELL WIDTH BENCHMARK")
+    print("=" * 70)
+    print("(unicodedata.east_asian_width per character vs Vargula.width())")
+    print()
+    
+    import unicodedata
+    import vargula
+    
+    def naive_width(text):
+        return sum(
+            0 if unicodedata.combining(c) else
+            2 if unicodedata.east_asian_width(c) in ("W", "F") else 1
+            for c in text
+        )
+    
+    cases = (
+        ("ascii host", "web-frontend-01", 100000),
+        ("cjk host", "東京-サーバー-01", 100000),
+        ("emoji status", "✅ healthy 🚀", 100000),
+    )
+    
+    for name, text, iterations in cases:
+        naive_time = measure_time(lambda: naive_width(text), iterations)
+        vargula.Vargula.width(text)
+        cached_time = measure_time(lambda: vargula.Vargula.width(text), iterations)
+        print(f"{name:13s} per-char {naive_time * 1000:7.3f}µs   width() {cached_time * 1000:7.3f}µs"
+              f"  ({naive_time / cached_time:5.1f}x)")
+    
+    unique = [f"ノード-{i}" for i in range(20000)]
+    vargula.Vargula.width("x")
+    start = time.perf_counter()
+    for text in unique:
+        vargula.Vargula.width(text)
+    uncached = (time.perf_counter() - start) * 1000
+    print(f"20,000 distinct CJK strings (uncached): {uncached:.3f}ms")
+    print()
+
+
+def benchmark_table_rerender():
+    """Benchmark re-rendering a large table after small updates"""
+    print("=" * 70)
+    print("21. TABLE RE-RENDER BENCHMARK (20,000 rows x 4 columns)")
+    print("=" * 70)
+    print("(Dashboard pattern: update a few cells, then render the whole table)")
+    print()
+    
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    rows = 20000
+    
+    table = vg.Table(title="Hosts")
+    table.add_column("Host", style="cyan")
+    table.add_column("Region")
+    table.add_column("Latency", justify="right")
+    table.add_column("Status", style="green")
+    
+    start = time.perf_counter()
+    for i in range(rows):
+        table.add_row(f"web-{i:05d}", "eu-west" if i % 2 else "東京", f"{i % 97}ms", "OK")
+    build_time = (time.perf_counter() - start) * 1000
+    
+    measured = [0]
+    width = vargula.Vargula.width
+    
+    def counting_width(text):
+        measured[0] += 1
+        return width(text)
+    
+    def rerender():
+        for i in range(0, rows, rows // 10):
+            table.update_cell(i, 2, f"{i % 89}ms")
+        return str(table)
+    
+    vargula.Vargula.width = staticmethod(counting_width)
+    try:
+        render_time = measure_time(rerender, 5)
+    finally:
+        vargula.Vargula.width = staticmethod(width)
+    
+    print(f"add_row x {rows}:      {build_time:9.3f}ms ({build_time * 1000 / rows:.2f}µs per row)")
+    print(f"update 10 + render:  {render_time:9.3f}ms")
+    print(f"width() calls per re-render: {measured[0] // 5} (updated cells only)")
+    print()
+
+
+def benchmark_table_streaming():
+    """Benchmark peak memory of exporting a large table"""
+    print("=" * 70)
+    print("22. TABLE STREAMING BENCHMARK (50,000 rows)")
+    print("=" * 70)
+    print("(Peak traced memory while rendering, excluding the stored rows)")
+    print()
+    
+    import tracemalloc
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    rows = 50000
+    
+    class Sink:
+        def __init__(self):
+            self.size = 0
+        
+        def write(self, data):
+            self.size += len(data)
+    
+    def make_table():
+        table = vg.Table()
+        table.add_column("Host")
+        table.add_column("Region")
+        table.add_column("Latency", justify="right")
+        return table
+    
+    table = make_table()
+    for i in range(rows):
+        table.add_row(f"web-{i:06d}", "eu-west", f"{i % 97}ms")
+    
+    def generated_rows():
+        for i in range(rows):
+            yield (f"web-{i:06d}", "eu-west", f"{i % 97}ms")
+    
+    cases = (
+        ("str(table)", lambda: len(str(table))),
+        ("write_to(fp)", lambda: table.write_to(Sink())),
+        ("write_to(rows=gen)", lambda: make_table().write_to(Sink(), rows=generated_rows(),
+                                                             widths=[10, 7, 7])),
+    )
+    
+    for name, run in cases:
+        tracemalloc.start()
+        start = time.perf_counter()
+        run()
+        elapsed = (time.perf_counter() - start) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:20s} {elapsed:9.1f}ms   peak {peak / 1024:10.1f} KB")
+    print()
+
+
+def benchmark_table_storage():
+    """Benchmark memory of row and columnar table storage"""
+    print("=" * 70)
+    print("23. TABLE STORAGE BENCHMARK (100,000 rows x 4 columns)")
+    print("=" * 70)
+    print("(tracemalloc: memory held by the table, including the cell strings)")
+    print()
+    
+    import gc
+    import tracemalloc
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    rows = 100000
+    statuses = ("OK", "WARN", "DOWN")
+    
+    results = {}
+    for storage in ("rows", "columns"):
+        gc.collect()
+        tracemalloc.start()
+        table = vg.Table(storage=storage)
+        table.add_column("Host")
+        table.add_column("Region")
+        table.add_column("Latency", justify="right")
+        table.add_column("Status")
+        for i in range(rows):
+            table.add_row(f"web-{i:06d}", "eu-west", f"{i % 97}ms", statuses[i % 3],
+                          style="dim" if i % 10 == 0 else None)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[storage] = current
+        print(f"storage={storage!r:10s} {current / 1024 / 1024:8.1f} MB   "
+              f"{current / rows:6.1f} bytes/row")
+        del table
+    
+    print(f"\nColumnar storage uses {results['rows'] / results['columns']:.1f}x less memory")
+    print()
+
+
+def benchmark_table_styles():
+    """Benchmark the cost of styled cells, borders and progress bars"""
+    print("=" * 70)
+    print("24. STYLED RENDERING BENCHMARK (10,000 rows x 4 columns)")
+    print("=" * 70)
+    print("(Styled table vs the same table without styles)")
+    print()
+    
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    
+    def make_table(styled):
+        table = vg.Table(border_style="dim blue" if styled else None,
+                         header_style="bold magenta" if styled else None)
+        table.add_column("Host", style="bold cyan" if styled else None)
+        table.add_column("Region", style="yellow" if styled else None)
+        table.add_column("Latency", justify="right")
+        table.add_column("Status", style="green" if styled else None)
+        for i in range(10000):
+            table.add_row(f"web-{i:05d}", "eu-west", f"{i % 97}ms", "OK")
+        return table
+    
+    plain = make_table(False)
+    styled = make_table(True)
+    plain_time = measure_time(lambda: str(plain), 3)
+    styled_time = measure_time(lambda: str(styled), 3)
+    print(f"unstyled render: {plain_time:8.3f}ms")
+    print(f"styled render:   {styled_time:8.3f}ms  ({styled_time / plain_time:.2f}x the unstyled time)")
+    
+    bar = vg.ProgressBar(total=100, complete_style="green bold", incomplete_style="dim")
+    bar.current = 50
+    render_time = measure_time(bar._render, 10000)
+    print(f"progress bar render: {render_time * 1000:.3f}µs")
+    print()
+
+
+def benchmark_table_viewport():
+    """Benchmark rendering a 40-row window of growing tables"""
+    print("=" * 70)
+    print("25. TABLE VIEWPORT BENCHMARK (40-row window)")
+    print("=" * 70)
+    print("(Scrolling a terminal UI: render rows[a:a+40] with frozen widths)")
+    print()
+    
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    
+    for rows in (10000, 100000, 400000):
+        table = vg.Table(storage="columns")
+        table.add_column("Host", style="cyan")
+        table.add_column("Region")
+        table.add_column("Latency", justify="right")
+        for i in range(rows):
+            table.add_row(f"web-{i:06d}", "eu-west", f"{i % 97}ms")
+        
+        freeze_time = measure_time(lambda: table.freeze_widths(sample=1000), 10)
+        top = [0]
+        
+        def scroll():
+            table.viewport(top[0], top[0] + 40)
+            top[0] = (top[0] + 40 * 997) % (rows - 40)
+        
+        window_time = measure_time(scroll, 200)
+        print(f"{rows:7d} rows: viewport {window_time * 1000:8.1f}µs   freeze_widths(sample=1000) "
+              f"{freeze_time * 1000:8.1f}µs")
+    print()
+
+
+def benchmark_live_table():
+    """Benchmark in-place refresh of a live status board"""
+    print("=" * 70)
+    print("26. LIVE TABLE BENCHMARK (500-row board, 5 cell updates per tick)")
+    print("=" * 70)
+    print("(Reprinting str(table) every tick vs table.refresh() repainting dirty rows)")
+    print()
+    
+    import random
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    rng = random.Random(5)
+    statuses = ("OK  ", "WARN", "DOWN")
+    ticks = 100
+    
+    class Sink:
+        def __init__(self):
+            self.size = 0
+        
+        def write(self, data):
+            self.size += len(data)
+        
+        def flush(self):
+            pass
+    
+    def make_board(live):
+        board = vg.Table(title="Services", live=live, border_style="dim")
+        board.add_column("Service", style="cyan")
+        board.add_column("Status", style="bold")
+        board.add_column("Latency", justify="right")
+        for i in range(500):
+            board.add_row(f"svc-{i:03d}", "OK  ", f"{i % 90 + 10}ms")
+        return board
+    
+    def tick(board):
+        for _ in range(5):
+            board.update_cell(rng.randrange(500), 1, rng.choice(statuses))
+    
+    board = make_board(False)
+    sink = Sink()
+    
+    def reprint():
+        tick(board)
+        sink.write("\x1b[H" + str(board) + "\n")
+    
+    reprint_time = measure_time(reprint, ticks)
+    reprint_bytes = sink.size / ticks
+    
+    board = make_board(True)
+    sink = Sink()
+    board.refresh(sink)
+    sink.size = 0
+    
+    def refresh():
+        tick(board)
+        board.refresh(sink)
+    
+    refresh_time = measure_time(refresh, ticks)
+    refresh_bytes = sink.size / ticks
+    
+    print(f"full reprint: {reprint_time:8.3f}ms/tick  {reprint_bytes / 1024:8.1f} KB/tick")
+    print(f"refresh():    {refresh_time:8.3f}ms/tick  {refresh_bytes / 1024:8.1f} KB/tick")
+    print()
+
+
+def benchmark_parallel_export():
+    """Benchmark exporting a large styled table across worker processes"""
+    print("=" * 70)
+    print("27. PARALLEL EXPORT BENCHMARK (200,000 rows x 4 columns)")
+    print("=" * 70)
+    print("(write_to() on one core vs write_parallel() with a process pool)")
+    print()
+    
+    import os
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    
+    class Sink:
+        def __init__(self):
+            self.size = 0
+        
+        def write(self, data):
+            self.size += len(data)
+    
+    table = vg.Table(border_style="dim", storage="columns")
+    table.add_column("Host", style="bold cyan")
+    table.add_column("Region", style="yellow")
+    table.add_column("Latency", justify="right")
+    table.add_column("Status", style="green")
+    for i in range(200000):
+        table.add_row(f"web-{i:06d}", "eu-west", f"{i % 97}ms", "OK")
+    
+    serial_time = measure_time(lambda: table.write_to(Sink()))
+    print(f"write_to():                 {serial_time:9.1f}ms")
+    cores = os.cpu_count() or 1
+    for workers in sorted({1, 2, 4, cores}):
+        parallel_time = measure_time(lambda: table.write_parallel(Sink(), workers=workers))
+        print(f"write_parallel(workers={workers:2d}): {parallel_time:9.1f}ms  ({serial_time / parallel_time:5.2f}x)")
+    print(f"({cores} CPU core(s) available)")
+    print()
+
+
+def benchmark_bulk_ingestion():
+    """Benchmark loading a query-sized result set into a table"""
+    print("=" * 70)
+    print("28. BULK INGESTION BENCHMARK (200,000 rows x 4 columns)")
+    print("=" * 70)
+    print("(add_row() loop vs add_rows() vs from_columns() with a ',.2f' price column)")
+    print()
+    
+    from array import array
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    
+    n_rows = 200000
+    result = [(i, f"web-{i:06d}", i * 1.25, "OK") for i in range(n_rows)]
+    columns = {
+        "ID": array("q", range(n_rows)),
+        "Host": [row[1] for row in result],
+        "Price": array("d", (row[2] for row in result)),
+        "Status": ["OK"] * n_rows,
+    }
+    
+    def new_table():
+        table = vg.Table(storage="columns")
+        for header in columns:
+            table.add_column(header)
+        return table
+    
+    def row_loop():
+        table = new_table()
+        for row_id, host, price, status in result:
+            table.add_row(row_id, host, f"{price:,.2f}", status)
+    
+    def bulk_rows():
+        new_table().add_rows(result, formats={"Price": ",.2f"})
+    
+    def bulk_columns():
+        new_table().from_columns(columns, formats={"Price": ",.2f"})
+    
+    loop_time = measure_time(row_loop, iterations=3)
+    print(f"add_row() loop:  {loop_time:8.1f}ms  (~{loop_time * 5 / 1000:5.2f}s per 1M rows)")
+    for label, func in (("add_rows():     ", bulk_rows), ("from_columns(): ", bulk_columns)):
+        bulk_time = measure_time(func, iterations=3)
+        print(f"{label} {bulk_time:8.1f}ms  (~{bulk_time * 5 / 1000:5.2f}s per 1M rows, {loop_time / bulk_time:4.1f}x)")
+    print()
+
+
+def benchmark_sampled_widths():
+    """Benchmark time to first line when streaming a large report"""
+    print("=" * 70)
+    print("29. SAMPLED WIDTH BENCHMARK (300,000 streamed rows x 3 columns)")
+    print("=" * 70)
+    print("(exact widths need every row first; sampled widths stream after 1,000 rows)")
+    print()
+    
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    n_rows = 300000
+    
+    def query():
+        for i in range(n_rows):
+            yield (f"web-{i:06d}", "eu-west", f"{i % 997}ms")
+    
+    def new_table(**options):
+        table = vg.Table(border_style="dim", **options)
+        table.add_column("Host", style="bold cyan")
+        table.add_column("Region", style="yellow")
+        table.add_column("Latency", justify="right")
+        return table
+    
+    def exact():
+        start = time.perf_counter()
+        table = new_table()
+        table.add_rows(query())
+        lines = table.iter_lines()
+        next(lines)
+        first = time.perf_counter() - start
+        for _ in lines:
+            pass
+        return first, time.perf_counter() - start
+    
+    def sampled(strategy):
+        start = time.perf_counter()
+        lines = new_table(width_strategy=strategy, sample_size=1000).iter_lines(rows=query())
+        next(lines)
+        first = time.perf_counter() - start
+        for _ in lines:
+            pass
+        return first, time.perf_counter() - start
+    
+    for label, func in (("exact (buffered):", exact),
+                        ("sample:          ", lambda: sampled("sample")),
+                        ("reservoir:       ", lambda: sampled("reservoir"))):
+        first, total = func()
+        print(f"{label} first line {first * 1000:8.1f}ms, all lines {total * 1000:8.1f}ms")
+    print()
+
+
+def benchmark_progress_update():
+    """Benchmark per-call overhead of ProgressBar.update() in a tight loop"""
+    print("=" * 70)
+    print("30. PROGRESS UPDATE OVERHEAD BENCHMARK (2,000,000 updates)")
+    print("=" * 70)
+    print("(nanoseconds per update() call, empty loop subtracted)")
+    print()
+    
+    from contextlib import redirect_stdout
+    import vargula
+    vg = vargula.Vargula(enabled=True)
+    n = 2000000
+    
+    def loop(bar):
+        update = bar.update if bar else None
+        start = time.perf_counter_ns()
+        if update:
+            for _ in range(n):
+                update()
+        else:
+            for _ in range(n):
+                pass
+        return time.perf_counter_ns() - start
+    
+    def warmed_up(seconds=2.0):
+        # miniters at most doubles per redraw, so long loops run past the ramp-up
+        bar = vg.ProgressBar(total=10 ** 12)
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            for _ in range(10000):
+                bar.update()
+        return bar
+    
+    baseline = loop(None)
+    with redirect_stdout(StringIO()):
+        cold = loop(vg.ProgressBar(total=n))
+        steady = loop(warmed_up())
+        every_call = loop(vg.ProgressBar(total=n, miniters=1))
+    print(f"update(), adaptive, from start:  {(cold - baseline) / n:7.1f}ns")
+    print(f"update(), adaptive, steady state:{(steady - baseline) / n:7.1f}ns")
+    print(f"update(), miniters=1:            {(every_call - baseline) / n:7.1f}ns")
+    print()
+
+
 def print_summary():
     """Print benchmark summary"""
     print("=" * 70)
@@ -404,6 +1272,26 @@ def main():
         benchmark_palette_generation()
         benchmark_accessibility()
         benchmark_real_world()
+        benchmark_markup_scaling()
+        benchmark_compiled_templates()
+        benchmark_instance_creation()
+        benchmark_delta_sgr()
+        benchmark_console_writes()
+        benchmark_async_console()
+        benchmark_shared_instance_threads()
+        benchmark_color_depth()
+        benchmark_visible_length()
+        benchmark_cell_width()
+        benchmark_table_rerender()
+        benchmark_table_streaming()
+        benchmark_table_storage()
+        benchmark_table_styles()
+        benchmark_table_viewport()
+        benchmark_live_table()
+        benchmark_parallel_export()
+        benchmark_bulk_ingestion()
+        benchmark_sampled_widths()
+        benchmark_progress_update()
         print_summary()
         
     except ImportError as e:
@@ -22,11 +22,20 @@ import os
 import re
 import random
 import colorsys
+import copy
 import json
+import threading
 import time
+import weakref
+from array import array
+from bisect import bisect_right
+from collections import Counter, OrderedDict, deque
 from contextlib import contextmanager
+from itertools import chain, islice
 from typing import List, Tuple, Dict, Literal, Optional
 from pathlib import Path
+from string import Formatter
+from types import MappingProxyType
 
 # Type definitions
 PaletteScheme = Literal[
@@ -65,12 +74,684 @@ LOOKS = {
     "blink": 5, "reverse": 7, "hidden": 8, "strikethrough": 9,
 }
 
+def _build_predefined_styles():
+    """Build the read-only style definitions for built-in color, background and look tags."""
+    styles = {}
+    for color_name in COLORS:
+        styles[color_name] = MappingProxyType({"color": color_name, "bg": None, "look": None})
+    for bg_name in BG_COLORS:
+        styles[bg_name] = MappingProxyType({"color": None, "bg": bg_name, "look": None})
+    for look_name in LOOKS:
+        styles[look_name] = MappingProxyType({"color": None, "bg": None, "look": look_name})
+    return MappingProxyType(styles)
+
+
+def _build_predefined_codes():
+    """Build the read-only SGR codes of the built-in tags."""
+    codes = {}
+    for color_name, code in COLORS.items():
+        codes[color_name] = (str(code),)
+    for bg_name, code in BG_COLORS.items():
+        codes[bg_name] = (str(code),)
+    for look_name, code in LOOKS.items():
+        codes[look_name] = (str(code),)
+    return MappingProxyType(codes)
+
+
+# Built-in styles shared by every instance; instances copy on first write
+_PREDEFINED_STYLES = _build_predefined_styles()
+_PREDEFINED_CODES = _build_predefined_codes()
+
+# Process-wide terminal detection state
+_windows_ansi_enabled = False
+_tty_cache = (None, False)
+_color_depth_cache = None
+_color_env_cache = None
+
+
+def _enable_windows_ansi():
+    """Enable ANSI escape processing on the Windows console (once per process)."""
+    global _windows_ansi_enabled
+    if _windows_ansi_enabled or sys.platform != "win32":
+        return
+    _windows_ansi_enabled = True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_ulong()
+        kernel32.GetConsoleMode(handle, ctypes.byref(mode))
+        mode.value |= 0x0004
+        kernel32.SetConsoleMode(handle, mode)
+    except Exception:
+        pass
+
+
+def _stdout_isatty() -> bool:
+    """Return whether sys.stdout is a terminal, cached per stream object."""
+    global _tty_cache
+    stream = sys.stdout
+    cached_stream, result = _tty_cache
+    if stream is not cached_stream:
+        result = not hasattr(stream, "isatty") or stream.isatty()
+        _tty_cache = (stream, result)
+    return result
+
+
+def _color_env_mode() -> str:
+    """Return "off" for NO_COLOR, "force" for FORCE_COLOR, else "auto", read once per process."""
+    global _color_env_cache
+    mode = _color_env_cache
+    if mode is None:
+        if os.getenv("NO_COLOR"):
+            mode = "off"
+        elif os.getenv("FORCE_COLOR"):
+            mode = "force"
+        else:
+            mode = "auto"
+        _color_env_cache = mode
+    return mode
+
+
+# Supported color depths in bits: truecolor, xterm-256 and the 16 ANSI colors
+COLOR_DEPTHS = (24, 8, 4)
+
+# Terminals known to understand only the 16 ANSI colors. Generic names such
+# as xterm or screen are also used by truecolor terminals (SSH, Docker, tmux)
+# and keep the 24-bit default.
+_16_COLOR_TERMS = frozenset(("ansi", "cygwin", "linux", "vt100"))
+
+
+def _detect_color_depth(refresh: bool = False) -> int:
+    """Return the terminal color depth, read from the environment once per process.
+    
+    Args:
+        refresh: Read COLORTERM and TERM again instead of using the cached depth
+    """
+    global _color_depth_cache
+    depth = _color_depth_cache
+    if depth is None or refresh:
+        depth = _color_depth_cache = _read_color_depth()
+    return depth
+
+
+def _read_color_depth() -> int:
+    """Guess the terminal color depth from COLORTERM and TERM.
+    
+    Only terminals that advertise a limit (``*256color*``, ``*16color*`` or
+    a known 16-color TERM) are downgraded; anything else gets 24-bit color.
+    """
+    colorterm = os.getenv("COLORTERM", "").lower()
+    if colorterm in ("truecolor", "24bit"):
+        return 24
+    term = os.getenv("TERM", "").lower()
+    if not term:
+        return 24
+    if "truecolor" in term or "24bit" in term or "direct" in term:
+        return 24
+    if "256" in term:
+        return 8
+    if "16color" in term or term in _16_COLOR_TERMS:
+        return 4
+    return 24
+
+
+# xterm-256 color cube levels and the cube index nearest to each channel value
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_CUBE_INDEX = bytes(
+    min(range(6), key=lambda i: abs(_CUBE_LEVELS[i] - v)) for v in range(256)
+)
+# Grayscale ramp 232-255 (8, 18, ..., 238) and the ramp step nearest to each value
+_GRAY_INDEX = bytes(min(23, max(0, (v - 3) // 10)) for v in range(256))
+
+# xterm default RGB values of the 16 ANSI colors, in palette order
+_ANSI_16_RGB = (
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0),
+    (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0),
+    (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255),
+)
+# RGB is quantized to 4 bits per channel for the 16-color lookup table
+_ANSI_16_SHIFT = 4
+_ansi_16_table = None
+
+
+def _rgb_to_256(r: int, g: int, b: int) -> int:
+    """Return the xterm-256 index nearest to an RGB color."""
+    ri, gi, bi = _CUBE_INDEX[r], _CUBE_INDEX[g], _CUBE_INDEX[b]
+    cr, cg, cb = _CUBE_LEVELS[ri], _CUBE_LEVELS[gi], _CUBE_LEVELS[bi]
+    gray = _GRAY_INDEX[(r + g + b) // 3]
+    level = 8 + 10 * gray
+    cube_dist = (r - cr) ** 2 + (g - cg) ** 2 + (b - cb) ** 2
+    gray_dist = (r - level) ** 2 + (g - level) ** 2 + (b - level) ** 2
+    if gray_dist < cube_dist:
+        return 232 + gray
+    return 16 + 36 * ri + 6 * gi + bi
+
+
+def _build_ansi_16_table() -> bytes:
+    """Map every quantized RGB cell to its nearest ANSI-16 palette index."""
+    step = 1 << _ANSI_16_SHIFT
+    half = step // 2
+    cells = 256 // step
+    table = bytearray(cells ** 3)
+    pos = 0
+    for qr in range(cells):
+        r = qr * step + half
+        for qg in range(cells):
+            g = qg * step + half
+            for qb in range(cells):
+                b = qb * step + half
+                best, best_dist = 0, None
+                for index, (pr, pg, pb) in enumerate(_ANSI_16_RGB):
+                    dist = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+                    if best_dist is None or dist < best_dist:
+                        best, best_dist = index, dist
+                table[pos] = best
+                pos += 1
+    return bytes(table)
+
+
+def _rgb_to_16(r: int, g: int, b: int) -> int:
+    """Return the ANSI-16 palette index nearest to an RGB color."""
+    global _ansi_16_table
+    table = _ansi_16_table
+    if table is None:
+        table = _ansi_16_table = _build_ansi_16_table()
+    shift = _ANSI_16_SHIFT
+    bits = 8 - shift
+    return table[(((r >> shift) << bits) | (g >> shift)) << bits | (b >> shift)]
+
+
+# SGR attribute state used by delta emission: (foreground, background, looks)
+_EMPTY_SGR_STATE = (None, None, frozenset())
+
+# SGR parameters that switch a single look off (22 clears both bold and dim)
+_LOOK_OFF = {"1": "22", "2": "22", "3": "23", "4": "24", "5": "25", "7": "27", "8": "28", "9": "29"}
+
+_sgr_kinds = {}
+
+
+def _sgr_kind(code: str) -> str:
+    """Classify an SGR parameter as "fg", "bg" or "look"."""
+    head = code.split(";", 1)[0]
+    kind = _sgr_kinds.get(head)
+    if kind is None:
+        value = int(head) if head.isdigit() else -1
+        if 30 <= value <= 39 or 90 <= value <= 97:
+            kind = "fg"
+        elif 40 <= value <= 49 or 100 <= value <= 107:
+            kind = "bg"
+        else:
+            kind = "look"
+        _sgr_kinds[head] = kind
+    return kind
+
+
+def _sgr_apply(state, codes):
+    """Return the attribute state after applying SGR codes to state."""
+    fg, bg, looks = state
+    added = []
+    for code in codes:
+        kind = _sgr_kind(code)
+        if kind == "fg":
+            fg = code
+        elif kind == "bg":
+            bg = code
+        else:
+            added.append(code)
+    if added:
+        looks = looks.union(added)
+    return (fg, bg, looks)
+
+
+def _sgr_transition(current, target) -> str:
+    """Return the shortest SGR parameters that turn state current into target."""
+    t_fg, t_bg, t_looks = target
+    full = [code for code in (t_fg, t_bg) if code]
+    full.extend(sorted(t_looks, key=int))
+    reset = ";".join(["0"] + full)
+    
+    c_fg, c_bg, c_looks = current
+    offs = []
+    restore = t_looks - c_looks
+    for look in sorted(c_looks - t_looks, key=int):
+        off = _LOOK_OFF.get(look)
+        if off is None:
+            return reset
+        if off not in offs:
+            offs.append(off)
+        if off == "22":
+            restore = restore | (t_looks & {"1", "2"})
+    if c_fg != t_fg:
+        offs.append(t_fg or "39")
+    if c_bg != t_bg:
+        offs.append(t_bg or "49")
+    offs.extend(sorted(restore, key=int))
+    
+    delta = ";".join(offs)
+    return delta if len(delta) <= len(reset) else reset
+
+
+# Markup strings longer than this are formatted without being cached
+FORMAT_CACHE_MAX_TEXT = 4096
+
+# Markup tags removed by strip() when styling is disabled
+_STRIP_TAGS = re.compile(r'</?[\w_#-]+>')
+
+# ANSI escape sequences: two-byte escapes and CSI sequences (SGR, cursor movement)
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Markup tokens: escaped brackets (\< and \>), opening tags and closing tags
+_MARKUP_TOKEN = re.compile(r'\\([<>])|<(/?)(@?#?[\w_#-]+)>')
+
+
+class _LRUCache:
+    """Bounded mapping with CLOCK (second-chance) eviction and hit/miss counters.
+    
+    Hits never reorder or resize the mapping: a lookup only sets the entry's
+    reference bit, and only the first time the entry is found after being
+    stored or swept, so hot entries stay read-only and threads formatting the
+    same markup do not contend on the mapping on free-threaded builds. put()
+    evicts from the oldest end, moving referenced entries to the back once
+    with their bit cleared, which approximates least-recently-used order.
+    
+    Safe to share between threads without a lock: a concurrent eviction only
+    turns a hit into a miss, and the counters are approximate under contention.
+    """
+    
+    __slots__ = ("maxsize", "hits", "misses", "_data")
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+    
+    def get(self, key, default=None):
+        """Return the cached value for key, marking it as referenced."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if not entry[1]:
+            entry[1] = True
+        self.hits += 1
+        return entry[0]
+    
+    def put(self, key, value):
+        """Store value under key, evicting the oldest unreferenced entries."""
+        if self.maxsize <= 0:
+            return
+        data = self._data
+        try:
+            data[key] = [value, False]
+            while len(data) > self.maxsize:
+                old_key, entry = data.popitem(last=False)
+                if entry[1]:
+                    entry[1] = False
+                    data[old_key] = entry
+        except KeyError:
+            # Another thread emptied the mapping first
+            pass
+    
+    def clear(self):
+        """Drop all entries (hit/miss counters are kept)."""
+        self._data.clear()
+    
+    def info(self) -> Dict[str, int]:
+        """Return cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._data),
+        }
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _StyleRegistry:
+    """Published snapshot of the merged style registry and its compiled caches.
+    
+    The styles mapping of a snapshot is never modified. Style changes build a
+    new snapshot and publish it with a single attribute assignment, so readers
+    holding the old snapshot keep a consistent view without locking, and
+    output compiled against old styles can only land in the old caches.
+    
+    The caches are created on first access, so instances that are created
+    and dropped without formatting anything never build them.
+    """
+    
+    _CACHES = ("format_cache", "bytes_cache", "affix_cache")
+    __slots__ = ("styles", "version", "cache_size") + _CACHES
+    
+    def __init__(self, styles, version: int, cache_size: int, previous: '_StyleRegistry' = None):
+        self.styles = styles
+        self.version = version
+        self.cache_size = cache_size
+        if previous is not None:
+            for name in ("format_cache", "bytes_cache"):
+                old = previous.existing_cache(name)
+                if old is not None and (old.hits or old.misses):
+                    new = getattr(self, name)
+                    new.hits = old.hits
+                    new.misses = old.misses
+    
+    def __getattr__(self, name):
+        # Only reached while a cache slot is still empty
+        if name not in _StyleRegistry._CACHES:
+            raise AttributeError(name)
+        cache = _LRUCache(self.cache_size)
+        setattr(self, name, cache)
+        return cache
+    
+    def existing_cache(self, name: str) -> Optional[_LRUCache]:
+        """Return the named cache if it has been created, without creating it."""
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            return None
+    
+    def replace(self, styles) -> '_StyleRegistry':
+        """Return the next snapshot with new styles and empty caches."""
+        return _StyleRegistry(styles, self.version + 1, self.cache_size, previous=self)
+
+
+# Color specs whose resolved SGR codes are kept, shared by all instances
+SGR_CACHE_SIZE = 1024
+_sgr_cache = _LRUCache(SGR_CACHE_SIZE)
+_MISSING = object()
+
+
+# Terminal cell width of code points whose width is not 1, as (first, last, width).
+# Width 0: combining marks, format characters (ZWJ, variation selectors) and Hangul
+# medial/final jamo. Width 2: East Asian Wide and Fullwidth characters, including
+# emoji presentation. Generated from the Unicode 14.0 character database.
+_CELL_WIDTH_RANGES = (
+    (0x0300, 0x036F, 0), (0x0483, 0x0489, 0), (0x0591, 0x05BD, 0), (0x05BF, 0x05BF, 0),
+    (0x05C1, 0x05C2, 0), (0x05C4, 0x05C5, 0), (0x05C7, 0x05C7, 0), (0x0600, 0x0605, 0),
+    (0x0610, 0x061A, 0), (0x061C, 0x061C, 0), (0x064B, 0x065F, 0), (0x0670, 0x0670, 0),
+    (0x06D6, 0x06DD, 0), (0x06DF, 0x06E4, 0), (0x06E7, 0x06E8, 0), (0x06EA, 0x06ED, 0),
+    (0x070F, 0x070F, 0), (0x0711, 0x0711, 0), (0x0730, 0x074A, 0), (0x07A6, 0x07B0, 0),
+    (0x07EB, 0x07F3, 0), (0x07FD, 0x07FD, 0), (0x0816, 0x0819, 0), (0x081B, 0x0823, 0),
+    (0x0825, 0x0827, 0), (0x0829, 0x082D, 0), (0x0859, 0x085B, 0), (0x0890, 0x0891, 0),
+    (0x0898, 0x089F, 0), (0x08CA, 0x0902, 0), (0x093A, 0x093A, 0), (0x093C, 0x093C, 0),
+    (0x0941, 0x0948, 0), (0x094D, 0x094D, 0), (0x0951, 0x0957, 0), (0x0962, 0x0963, 0),
+    (0x0981, 0x0981, 0), (0x09BC, 0x09BC, 0), (0x09C1, 0x09C4, 0), (0x09CD, 0x09CD, 0),
+    (0x09E2, 0x09E3, 0), (0x09FE, 0x09FE, 0), (0x0A01, 0x0A02, 0), (0x0A3C, 0x0A3C, 0),
+    (0x0A41, 0x0A42, 0), (0x0A47, 0x0A48, 0), (0x0A4B, 0x0A4D, 0), (0x0A51, 0x0A51, 0),
+    (0x0A70, 0x0A71, 0), (0x0A75, 0x0A75, 0), (0x0A81, 0x0A82, 0), (0x0ABC, 0x0ABC, 0),
+    (0x0AC1, 0x0AC5, 0), (0x0AC7, 0x0AC8, 0), (0x0ACD, 0x0ACD, 0), (0x0AE2, 0x0AE3, 0),
+    (0x0AFA, 0x0AFF, 0), (0x0B01, 0x0B01, 0), (0x0B3C, 0x0B3C, 0), (0x0B3F, 0x0B3F, 0),
+    (0x0B41, 0x0B44, 0), (0x0B4D, 0x0B4D, 0), (0x0B55, 0x0B56, 0), (0x0B62, 0x0B63, 0),
+    (0x0B82, 0x0B82, 0), (0x0BC0, 0x0BC0, 0), (0x0BCD, 0x0BCD, 0), (0x0C00, 0x0C00, 0),
+    (0x0C04, 0x0C04, 0), (0x0C3C, 0x0C3C, 0), (0x0C3E, 0x0C40, 0), (0x0C46, 0x0C48, 0),
+    (0x0C4A, 0x0C4D, 0), (0x0C55, 0x0C56, 0), (0x0C62, 0x0C63, 0), (0x0C81, 0x0C81, 0),
+    (0x0CBC, 0x0CBC, 0), (0x0CBF, 0x0CBF, 0), (0x0CC6, 0x0CC6, 0), (0x0CCC, 0x0CCD, 0),
+    (0x0CE2, 0x0CE3, 0), (0x0D00, 0x0D01, 0), (0x0D3B, 0x0D3C, 0), (0x0D41, 0x0D44, 0),
+    (0x0D4D, 0x0D4D, 0), (0x0D62, 0x0D63, 0), (0x0D81, 0x0D81, 0), (0x0DCA, 0x0DCA, 0),
+    (0x0DD2, 0x0DD4, 0), (0x0DD6, 0x0DD6, 0), (0x0E31, 0x0E31, 0), (0x0E34, 0x0E3A, 0),
+    (0x0E47, 0x0E4E, 0), (0x0EB1, 0x0EB1, 0), (0x0EB4, 0x0EBC, 0), (0x0EC8, 0x0ECD, 0),
+    (0x0F18, 0x0F19, 0), (0x0F35, 0x0F35, 0), (0x0F37, 0x0F37, 0), (0x0F39, 0x0F39, 0),
+    (0x0F71, 0x0F7E, 0), (0x0F80, 0x0F84, 0), (0x0F86, 0x0F87, 0), (0x0F8D, 0x0F97, 0),
+    (0x0F99, 0x0FBC, 0), (0x0FC6, 0x0FC6, 0), (0x102D, 0x1030, 0), (0x1032, 0x1037, 0),
+    (0x1039, 0x103A, 0), (0x103D, 0x103E, 0), (0x1058, 0x1059, 0), (0x105E, 0x1060, 0),
+    (0x1071, 0x1074, 0), (0x1082, 0x1082, 0), (0x1085, 0x1086, 0), (0x108D, 0x108D, 0),
+    (0x109D, 0x109D, 0), (0x1100, 0x115F, 2), (0x1160, 0x11FF, 0), (0x135D, 0x135F, 0),
+    (0x1712, 0x1714, 0), (0x1732, 0x1733, 0), (0x1752, 0x1753, 0), (0x1772, 0x1773, 0),
+    (0x17B4, 0x17B5, 0), (0x17B7, 0x17BD, 0), (0x17C6, 0x17C6, 0), (0x17C9, 0x17D3, 0),
+    (0x17DD, 0x17DD, 0), (0x180B, 0x180F, 0), (0x1885, 0x1886, 0), (0x18A9, 0x18A9, 0),
+    (0x1920, 0x1922, 0), (0x1927, 0x1928, 0), (0x1932, 0x1932, 0), (0x1939, 0x193B, 0),
+    (0x1A17, 0x1A18, 0), (0x1A1B, 0x1A1B, 0), (0x1A56, 0x1A56, 0), (0x1A58, 0x1A5E, 0),
+    (0x1A60, 0x1A60, 0), (0x1A62, 0x1A62, 0), (0x1A65, 0x1A6C, 0), (0x1A73, 0x1A7C, 0),
+    (0x1A7F, 0x1A7F, 0), (0x1AB0, 0x1ACE, 0), (0x1B00, 0x1B03, 0), (0x1B34, 0x1B34, 0),
+    (0x1B36, 0x1B3A, 0), (0x1B3C, 0x1B3C, 0), (0x1B42, 0x1B42, 0), (0x1B6B, 0x1B73, 0),
+    (0x1B80, 0x1B81, 0), (0x1BA2, 0x1BA5, 0), (0x1BA8, 0x1BA9, 0), (0x1BAB, 0x1BAD, 0),
+    (0x1BE6, 0x1BE6, 0), (0x1BE8, 0x1BE9, 0), (0x1BED, 0x1BED, 0), (0x1BEF, 0x1BF1, 0),
+    (0x1C2C, 0x1C33, 0), (0x1C36, 0x1C37, 0), (0x1CD0, 0x1CD2, 0), (0x1CD4, 0x1CE0, 0),
+    (0x1CE2, 0x1CE8, 0), (0x1CED, 0x1CED, 0), (0x1CF4, 0x1CF4, 0), (0x1CF8, 0x1CF9, 0),
+    (0x1DC0, 0x1DFF, 0), (0x200B, 0x200F, 0), (0x202A, 0x202E, 0), (0x2060, 0x2064, 0),
+    (0x2066, 0x206F, 0), (0x20D0, 0x20F0, 0), (0x231A, 0x231B, 2), (0x2329, 0x232A, 2),
+    (0x23E9, 0x23EC, 2), (0x23F0, 0x23F0, 2), (0x23F3, 0x23F3, 2), (0x25FD, 0x25FE, 2),
+    (0x2614, 0x2615, 2), (0x2648, 0x2653, 2), (0x267F, 0x267F, 2), (0x2693, 0x2693, 2),
+    (0x26A1, 0x26A1, 2), (0x26AA, 0x26AB, 2), (0x26BD, 0x26BE, 2), (0x26C4, 0x26C5, 2),
+    (0x26CE, 0x26CE, 2), (0x26D4, 0x26D4, 2), (0x26EA, 0x26EA, 2), (0x26F2, 0x26F3, 2),
+    (0x26F5, 0x26F5, 2), (0x26FA, 0x26FA, 2), (0x26FD, 0x26FD, 2), (0x2705, 0x2705, 2),
+    (0x270A, 0x270B, 2), (0x2728, 0x2728, 2), (0x274C, 0x274C, 2), (0x274E, 0x274E, 2),
+    (0x2753, 0x2755, 2), (0x2757, 0x2757, 2), (0x2795, 0x2797, 2), (0x27B0, 0x27B0, 2),
+    (0x27BF, 0x27BF, 2), (0x2B1B, 0x2B1C, 2), (0x2B50, 0x2B50, 2), (0x2B55, 0x2B55, 2),
+    (0x2CEF, 0x2CF1, 0), (0x2D7F, 0x2D7F, 0), (0x2DE0, 0x2DFF, 0), (0x2E80, 0x2E99, 2),
+    (0x2E9B, 0x2EF3, 2), (0x2F00, 0x2FD5, 2), (0x2FF0, 0x2FFB, 2), (0x3000, 0x3029, 2),
+    (0x302A, 0x302D, 0), (0x302E, 0x303E, 2), (0x3041, 0x3096, 2), (0x3099, 0x309A, 0),
+    (0x309B, 0x30FF, 2), (0x3105, 0x312F, 2), (0x3131, 0x318E, 2), (0x3190, 0x31E3, 2),
+    (0x31F0, 0x321E, 2), (0x3220, 0x3247, 2), (0x3250, 0x4DBF, 2), (0x4E00, 0xA48C, 2),
+    (0xA490, 0xA4C6, 2), (0xA66F, 0xA672, 0), (0xA674, 0xA67D, 0), (0xA69E, 0xA69F, 0),
+    (0xA6F0, 0xA6F1, 0), (0xA802, 0xA802, 0), (0xA806, 0xA806, 0), (0xA80B, 0xA80B, 0),
+    (0xA825, 0xA826, 0), (0xA82C, 0xA82C, 0), (0xA8C4, 0xA8C5, 0), (0xA8E0, 0xA8F1, 0),
+    (0xA8FF, 0xA8FF, 0), (0xA926, 0xA92D, 0), (0xA947, 0xA951, 0), (0xA960, 0xA97C, 2),
+    (0xA980, 0xA982, 0), (0xA9B3, 0xA9B3, 0), (0xA9B6, 0xA9B9, 0), (0xA9BC, 0xA9BD, 0),
+    (0xA9E5, 0xA9E5, 0), (0xAA29, 0xAA2E, 0), (0xAA31, 0xAA32, 0), (0xAA35, 0xAA36, 0),
+    (0xAA43, 0xAA43, 0), (0xAA4C, 0xAA4C, 0), (0xAA7C, 0xAA7C, 0), (0xAAB0, 0xAAB0, 0),
+    (0xAAB2, 0xAAB4, 0), (0xAAB7, 0xAAB8, 0), (0xAABE, 0xAABF, 0), (0xAAC1, 0xAAC1, 0),
+    (0xAAEC, 0xAAED, 0), (0xAAF6, 0xAAF6, 0), (0xABE5, 0xABE5, 0), (0xABE8, 0xABE8, 0),
+    (0xABED, 0xABED, 0), (0xAC00, 0xD7A3, 2), (0xF900, 0xFAFF, 2), (0xFB1E, 0xFB1E, 0),
+    (0xFE00, 0xFE0F, 0), (0xFE10, 0xFE19, 2), (0xFE20, 0xFE2F, 0), (0xFE30, 0xFE52, 2),
+    (0xFE54, 0xFE66, 2), (0xFE68, 0xFE6B, 2), (0xFEFF, 0xFEFF, 0), (0xFF01, 0xFF60, 2),
+    (0xFFE0, 0xFFE6, 2), (0xFFF9, 0xFFFB, 0), (0x101FD, 0x101FD, 0), (0x102E0, 0x102E0, 0),
+    (0x10376, 0x1037A, 0), (0x10A01, 0x10A03, 0), (0x10A05, 0x10A06, 0), (0x10A0C, 0x10A0F, 0),
+    (0x10A38, 0x10A3A, 0), (0x10A3F, 0x10A3F, 0), (0x10AE5, 0x10AE6, 0), (0x10D24, 0x10D27, 0),
+    (0x10EAB, 0x10EAC, 0), (0x10F46, 0x10F50, 0), (0x10F82, 0x10F85, 0), (0x11001, 0x11001, 0),
+    (0x11038, 0x11046, 0), (0x11070, 0x11070, 0), (0x11073, 0x11074, 0), (0x1107F, 0x11081, 0),
+    (0x110B3, 0x110B6, 0), (0x110B9, 0x110BA, 0), (0x110BD, 0x110BD, 0), (0x110C2, 0x110C2, 0),
+    (0x110CD, 0x110CD, 0), (0x11100, 0x11102, 0), (0x11127, 0x1112B, 0), (0x1112D, 0x11134, 0),
+    (0x11173, 0x11173, 0), (0x11180, 0x11181, 0), (0x111B6, 0x111BE, 0), (0x111C9, 0x111CC, 0),
+    (0x111CF, 0x111CF, 0), (0x1122F, 0x11231, 0), (0x11234, 0x11234, 0), (0x11236, 0x11237, 0),
+    (0x1123E, 0x1123E, 0), (0x112DF, 0x112DF, 0), (0x112E3, 0x112EA, 0), (0x11300, 0x11301, 0),
+    (0x1133B, 0x1133C, 0), (0x11340, 0x11340, 0), (0x11366, 0x1136C, 0), (0x11370, 0x11374, 0),
+    (0x11438, 0x1143F, 0), (0x11442, 0x11444, 0), (0x11446, 0x11446, 0), (0x1145E, 0x1145E, 0),
+    (0x114B3, 0x114B8, 0), (0x114BA, 0x114BA, 0), (0x114BF, 0x114C0, 0), (0x114C2, 0x114C3, 0),
+    (0x115B2, 0x115B5, 0), (0x115BC, 0x115BD, 0), (0x115BF, 0x115C0, 0), (0x115DC, 0x115DD, 0),
+    (0x11633, 0x1163A, 0), (0x1163D, 0x1163D, 0), (0x1163F, 0x11640, 0), (0x116AB, 0x116AB, 0),
+    (0x116AD, 0x116AD, 0), (0x116B0, 0x116B5, 0), (0x116B7, 0x116B7, 0), (0x1171D, 0x1171F, 0),
+    (0x11722, 0x11725, 0), (0x11727, 0x1172B, 0), (0x1182F, 0x11837, 0), (0x11839, 0x1183A, 0),
+    (0x1193B, 0x1193C, 0), (0x1193E, 0x1193E, 0), (0x11943, 0x11943, 0), (0x119D4, 0x119D7, 0),
+    (0x119DA, 0x119DB, 0), (0x119E0, 0x119E0, 0), (0x11A01, 0x11A0A, 0), (0x11A33, 0x11A38, 0),
+    (0x11A3B, 0x11A3E, 0), (0x11A47, 0x11A47, 0), (0x11A51, 0x11A56, 0), (0x11A59, 0x11A5B, 0),
+    (0x11A8A, 0x11A96, 0), (0x11A98, 0x11A99, 0), (0x11C30, 0x11C36, 0), (0x11C38, 0x11C3D, 0),
+    (0x11C3F, 0x11C3F, 0), (0x11C92, 0x11CA7, 0), (0x11CAA, 0x11CB0, 0), (0x11CB2, 0x11CB3, 0),
+    (0x11CB5, 0x11CB6, 0), (0x11D31, 0x11D36, 0), (0x11D3A, 0x11D3A, 0), (0x11D3C, 0x11D3D, 0),
+    (0x11D3F, 0x11D45, 0), (0x11D47, 0x11D47, 0), (0x11D90, 0x11D91, 0), (0x11D95, 0x11D95, 0),
+    (0x11D97, 0x11D97, 0), (0x11EF3, 0x11EF4, 0), (0x13430, 0x13438, 0), (0x16AF0, 0x16AF4, 0),
+    (0x16B30, 0x16B36, 0), (0x16F4F, 0x16F4F, 0), (0x16F8F, 0x16F92, 0), (0x16FE0, 0x16FE3, 2),
+    (0x16FE4, 0x16FE4, 0), (0x16FF0, 0x16FF1, 2), (0x17000, 0x187F7, 2), (0x18800, 0x18CD5, 2),
+    (0x18D00, 0x18D08, 2), (0x1AFF0, 0x1AFF3, 2), (0x1AFF5, 0x1AFFB, 2), (0x1AFFD, 0x1AFFE, 2),
+    (0x1B000, 0x1B122, 2), (0x1B150, 0x1B152, 2), (0x1B164, 0x1B167, 2), (0x1B170, 0x1B2FB, 2),
+    (0x1BC9D, 0x1BC9E, 0), (0x1BCA0, 0x1BCA3, 0), (0x1CF00, 0x1CF2D, 0), (0x1CF30, 0x1CF46, 0),
+    (0x1D167, 0x1D169, 0), (0x1D173, 0x1D182, 0), (0x1D185, 0x1D18B, 0), (0x1D1AA, 0x1D1AD, 0),
+    (0x1D242, 0x1D244, 0), (0x1DA00, 0x1DA36, 0), (0x1DA3B, 0x1DA6C, 0), (0x1DA75, 0x1DA75, 0),
+    (0x1DA84, 0x1DA84, 0), (0x1DA9B, 0x1DA9F, 0), (0x1DAA1, 0x1DAAF, 0), (0x1E000, 0x1E006, 0),
+    (0x1E008, 0x1E018, 0), (0x1E01B, 0x1E021, 0), (0x1E023, 0x1E024, 0), (0x1E026, 0x1E02A, 0),
+    (0x1E130, 0x1E136, 0), (0x1E2AE, 0x1E2AE, 0), (0x1E2EC, 0x1E2EF, 0), (0x1E8D0, 0x1E8D6, 0),
+    (0x1E944, 0x1E94A, 0), (0x1F004, 0x1F004, 2), (0x1F0CF, 0x1F0CF, 2), (0x1F18E, 0x1F18E, 2),
+    (0x1F191, 0x1F19A, 2), (0x1F200, 0x1F202, 2), (0x1F210, 0x1F23B, 2), (0x1F240, 0x1F248, 2),
+    (0x1F250, 0x1F251, 2), (0x1F260, 0x1F265, 2), (0x1F300, 0x1F320, 2), (0x1F32D, 0x1F335, 2),
+    (0x1F337, 0x1F37C, 2), (0x1F37E, 0x1F393, 2), (0x1F3A0, 0x1F3CA, 2), (0x1F3CF, 0x1F3D3, 2),
+    (0x1F3E0, 0x1F3F0, 2), (0x1F3F4, 0x1F3F4, 2), (0x1F3F8, 0x1F43E, 2), (0x1F440, 0x1F440, 2),
+    (0x1F442, 0x1F4FC, 2), (0x1F4FF, 0x1F53D, 2), (0x1F54B, 0x1F54E, 2), (0x1F550, 0x1F567, 2),
+    (0x1F57A, 0x1F57A, 2), (0x1F595, 0x1F596, 2), (0x1F5A4, 0x1F5A4, 2), (0x1F5FB, 0x1F64F, 2),
+    (0x1F680, 0x1F6C5, 2), (0x1F6CC, 0x1F6CC, 2), (0x1F6D0, 0x1F6D2, 2), (0x1F6D5, 0x1F6D7, 2),
+    (0x1F6DD, 0x1F6DF, 2), (0x1F6EB, 0x1F6EC, 2), (0x1F6F4, 0x1F6FC, 2), (0x1F7E0, 0x1F7EB, 2),
+    (0x1F7F0, 0x1F7F0, 2), (0x1F90C, 0x1F93A, 2), (0x1F93C, 0x1F945, 2), (0x1F947, 0x1F9FF, 2),
+    (0x1FA70, 0x1FA74, 2), (0x1FA78, 0x1FA7C, 2), (0x1FA80, 0x1FA86, 2), (0x1FA90, 0x1FAAC, 2),
+    (0x1FAB0, 0x1FABA, 2), (0x1FAC0, 0x1FAC5, 2), (0x1FAD0, 0x1FAD9, 2), (0x1FAE0, 0x1FAE7, 2),
+    (0x1FAF0, 0x1FAF6, 2), (0x20000, 0x3FFFD, 2), (0xE0001, 0xE0001, 0), (0xE0020, 0xE007F, 0),
+    (0xE0100, 0xE01EF, 0),
+)
+_CELL_WIDTH_STARTS = tuple(first for first, _, _ in _CELL_WIDTH_RANGES)
+
+_ZWJ = 0x200D
+_VS16 = 0xFE0F
+
+# Widths of non-ASCII strings, shared by all instances
+WIDTH_CACHE_SIZE = 4096
+_width_cache = _LRUCache(WIDTH_CACHE_SIZE)
+
+
+def _cell_widths(text: str):
+    """Yield the cells each character of plain text adds to the display width.
+    
+    A character following a zero-width joiner merges into the previous glyph,
+    VS16 turns a preceding narrow symbol into a two-cell emoji, and skin tone
+    modifiers after an emoji add nothing.
+    """
+    starts = _CELL_WIDTH_STARTS
+    ranges = _CELL_WIDTH_RANGES
+    previous = 0
+    joined = False
+    for char in text:
+        code = ord(char)
+        width = 1
+        if code >= 0x300:
+            index = bisect_right(starts, code) - 1
+            if index >= 0 and code <= ranges[index][1]:
+                width = ranges[index][2]
+        if joined:
+            joined = False
+            width = 0
+        elif code == _ZWJ:
+            joined = True
+        elif code == _VS16:
+            if previous == 1:
+                previous = 2
+                width = 1
+        elif 0x1F3FB <= code <= 0x1F3FF and previous == 2:
+            width = 0
+        elif width:
+            previous = width
+        yield width
+
+
+def _truncate_width(text: str, width: int) -> Tuple[str, int]:
+    """Return the longest prefix of text that fits in width cells.
+    
+    ANSI escape sequences are kept whole, including those after the cut, so
+    styles opened in the prefix are still closed. Returns the prefix and the
+    number of cells it occupies.
+    """
+    if text.isascii() and '\x1b' not in text:
+        prefix = text[:max(width, 0)]
+        return prefix, len(prefix)
+    
+    parts = []
+    used = 0
+    full = False
+    pos = 0
+    matches = list(_ANSI_ESCAPE.finditer(text)) if '\x1b' in text else []
+    for match in matches + [None]:
+        end = len(text) if match is None else match.start()
+        if not full:
+            segment = text[pos:end]
+            cut = len(segment)
+            for index, cells in enumerate(_cell_widths(segment)):
+                if used + cells > width:
+                    cut = index
+                    full = True
+                    break
+                used += cells
+            parts.append(segment[:cut])
+        if match is not None:
+            parts.append(match.group())
+            pos = match.end()
+    return "".join(parts), used
+
+
+# Table without rows, and the text joining rendered rows, in a table export worker process
+_export_table = None
+_export_joiner = "\n"
+
+
+def _export_init(table, joiner: str):
+    """Process pool initializer: keep the table shell used to render row chunks."""
+    global _export_table, _export_joiner
+    _export_table = table
+    _export_joiner = joiner
+
+
+def _export_chunk(rows) -> str:
+    """Render a chunk of (cells, widths, style) rows into joined lines."""
+    render = _export_table._render_row
+    return _export_joiner.join([render(cells, widths, row_style=style) for cells, widths, style in rows])
+
+
+class _ProgressMonitor(threading.Thread):
+    """Daemon thread that un-sticks progress bars whose adaptive miniters is too large.
+    
+    update() does not read the clock between checks, so a bar that tuned
+    miniters to a fast rate would stop redrawing if the rate dropped. Like
+    tqdm's monitor, this thread looks at running bars every maxinterval and
+    resets miniters of any bar that has not redrawn for that long, so its
+    next update() redraws. It exits once no bars are registered.
+    """
+    
+    _instance = None
+    _lock = threading.Lock()
+    
+    def __init__(self):
+        super().__init__(name="vargula-progress-monitor", daemon=True)
+        self.bars = weakref.WeakSet()
+        self.wake = threading.Event()
+    
+    @classmethod
+    def register(cls, bar):
+        """Watch bar, starting the monitor thread if needed."""
+        with cls._lock:
+            monitor = cls._instance
+            if monitor is None or not monitor.is_alive():
+                monitor = cls._instance = cls()
+                monitor.bars.add(bar)
+                monitor.start()
+            else:
+                monitor.bars.add(bar)
+                monitor.wake.set()
+    
+    @classmethod
+    def unregister(cls, bar):
+        """Stop watching bar."""
+        monitor = cls._instance
+        if monitor is not None:
+            monitor.bars.discard(bar)
+    
+    def run(self):
+        while True:
+            with self._lock:
+                bars = list(self.bars)
+                if not bars:
+                    type(self)._instance = None
+                    return
+            interval = min(bar.maxinterval for bar in bars)
+            del bars
+            # A newly registered bar may need a shorter interval
+            if self.wake.wait(interval):
+                self.wake.clear()
+                continue
+            now = time.monotonic()
+            for bar in list(self.bars):
+                if now - bar.last_update_time >= bar.maxinterval and bar.miniters > 1:
+                    bar.miniters = 1
+                    bar._rate = None
+                    bar._next_check = min(bar.current + 1, bar.total)
+
 
 class Vargula:
     """Main vargula styling class with complete functionality.
     
-    Each instance maintains its own state (custom styles, themes, configuration)
-    and is thread-safe when used independently.
+    Each instance maintains its own state (custom styles, themes, configuration).
+    One instance can be shared across threads: format() and style() read an
+    immutable registry snapshot without locking, while style changes are
+    serialized and published atomically, so readers never see a half-applied
+    theme.
     
     Example:
         >>> vg = Vargula()
@@ -79,68 +760,111 @@ class Vargula:
         >>> print(vg.format("<warning>Warning!</warning>"))
     """
     __version__ = "2.0.0"
-    def __init__(self, enabled: Optional[bool] = None):
+    def __init__(self, enabled: Optional[bool] = None, format_cache_size: int = 256,
+                 delta_sgr: bool = False, color_depth: Optional[int] = None):
         """Initialize a new Vargula instance.
         
         Args:
             enabled: Override automatic detection. If None, auto-detect based on
-                    environment (NO_COLOR, FORCE_COLOR, tty status)
+                    environment (NO_COLOR, FORCE_COLOR, tty status). The
+                    environment variables are read once per process.
+            format_cache_size: Maximum number of compiled markup strings kept
+                    by format(). Use 0 to disable the cache.
+            delta_sgr: Emit only the attributes that change between nested
+                    tags instead of re-sending every inherited code. Renders
+                    the same with fewer bytes. Markup whose text already
+                    contains escape codes is rendered with full codes.
+            color_depth: Color depth in bits: 24 (true color), 8 (xterm-256)
+                    or 4 (16 ANSI colors). If None, detected from the
+                    COLORTERM and TERM environment variables, which are
+                    read once per process.
         """
         # Instance state
         self._custom_styles = {}
-        self._predefined_styles = {}
+        self._predefined_styles = _PREDEFINED_STYLES
         self._current_theme = {}
         
+        # Merged style registry (name -> pre-resolved SGR codes). It starts as the
+        # shared built-in table; every change publishes a new snapshot, whose
+        # version lets templates detect the change. Writers hold the lock.
+        self._registry = _StyleRegistry(_PREDEFINED_CODES, 0, format_cache_size)
+        self._lock = threading.Lock()
+        
         # Configuration
+        self._delta_sgr = delta_sgr
+        self._color_depth = self._check_color_depth(
+            _detect_color_depth() if color_depth is None else color_depth
+        )
         if enabled is None:
             self._enabled = self._auto_detect_support()
         else:
             self._enabled = enabled
             if enabled:
                 self._init_windows()
-        
-        # Initialize predefined styles
-        self._init_predefined_styles()
     
     def _auto_detect_support(self) -> bool:
         """Auto-detect if ANSI colors should be enabled."""
-        if os.getenv("NO_COLOR"):
+        mode = _color_env_mode()
+        if mode == "off":
             return False
         
-        if os.getenv("FORCE_COLOR"):
+        if mode == "force":
             self._init_windows()
             return True
         
-        if hasattr(sys.stdout, "isatty") and not sys.stdout.isatty():
+        if not _stdout_isatty():
             return False
         
         self._init_windows()
         return True
     
+    def __getstate__(self):
+        """Pickle without the writer lock and compiled caches, e.g. for worker processes."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_predefined_styles"]
+        registry = state.pop("_registry")
+        styles = None if registry.styles is _PREDEFINED_CODES else registry.styles
+        state["_registry_state"] = (styles, registry.version, registry.cache_size)
+        return state
+    
+    def __setstate__(self, state):
+        styles, version, cache_size = state.pop("_registry_state")
+        self.__dict__.update(state)
+        self._predefined_styles = _PREDEFINED_STYLES
+        self._registry = _StyleRegistry(_PREDEFINED_CODES if styles is None else styles, version, cache_size)
+        self._lock = threading.Lock()
+    
     def _init_windows(self):
         """Enable ANSI support on Windows."""
-        if sys.platform == "win32":
-            try:
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                handle = kernel32.GetStdHandle(-11)
-                mode = ctypes.c_ulong()
-                kernel32.GetConsoleMode(handle, ctypes.byref(mode))
-                mode.value |= 0x0004
-                kernel32.SetConsoleMode(handle, mode)
-            except Exception:
-                pass
-    
-    def _init_predefined_styles(self):
-        """Initialize predefined color and look tags."""
-        for color_name in COLORS.keys():
-            self._predefined_styles[color_name] = {"color": color_name, "bg": None, "look": None}
-        
-        for bg_name in BG_COLORS.keys():
-            self._predefined_styles[bg_name] = {"color": None, "bg": bg_name, "look": None}
-        
-        for look_name in LOOKS.keys():
-            self._predefined_styles[look_name] = {"color": None, "bg": None, "look": look_name}
+        _enable_windows_ansi()
+    
+    def _resolve_style(self, name: str) -> Optional[Tuple[str, ...]]:
+        """Resolve a style name to SGR codes (custom, then theme, then predefined)."""
+        for source in (self._custom_styles, self._current_theme, self._predefined_styles):
+            style_def = source.get(name)
+            if style_def is not None:
+                return tuple(self._collect_style_codes(
+                    color=style_def.get("color"),
+                    bg=style_def.get("bg"),
+                    look=style_def.get("look")
+                ))
+        return None
+    
+    def _update_styles(self, names):
+        """Re-resolve the registry entries for names and publish a new snapshot.
+        
+        Callers must hold self._lock.
+        """
+        registry = self._registry
+        styles = dict(registry.styles)
+        for name in names:
+            codes = self._resolve_style(name)
+            if codes is None:
+                styles.pop(name, None)
+            else:
+                styles[name] = codes
+        self._registry = registry.replace(styles)
     
     # ============================================
     # Color Conversion Utilities
@@ -160,8 +884,19 @@ class Vargula:
         return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
     
     @staticmethod
-    def _rgb_to_ansi(r: int, g: int, b: int, background: bool = False) -> str:
-        """Convert RGB to ANSI 24-bit true color code."""
+    def _rgb_to_ansi(r: int, g: int, b: int, background: bool = False, depth: int = 24) -> str:
+        """Convert RGB to an ANSI color code at the given color depth.
+        
+        24-bit depth emits true color; 8 and 4 bits map the color to the nearest
+        xterm-256 or ANSI-16 entry through precomputed lookup tables.
+        """
+        r, g, b = (min(255, max(0, int(c))) for c in (r, g, b))
+        if depth == 8:
+            return f"{48 if background else 38};5;{_rgb_to_256(r, g, b)}"
+        if depth == 4:
+            index = _rgb_to_16(r, g, b)
+            base = (40 if background else 30) if index < 8 else (100 if background else 90)
+            return str(base + index % 8)
         prefix = 48 if background else 38
         return f"{prefix};2;{r};{g};{b}"
     
@@ -170,8 +905,23 @@ class Vargula:
         if not color:
             return None
         
+        if isinstance(color, list):
+            color = tuple(color)
+        depth = self._color_depth
+        key = (color, background, depth)
+        code = _sgr_cache.get(key, _MISSING)
+        if code is _MISSING:
+            code = self._resolve_color(color, background, depth)
+            _sgr_cache.put(key, code)
+        return code
+    
+    def _resolve_color(self, color, background: bool, depth: int) -> Optional[str]:
+        """Resolve a color spec to its ANSI code at the given color depth, without caching."""
         color_dict = BG_COLORS if background else COLORS
-        color_key = f"bg_{color}" if background and not color.startswith("bg_") else color
+        if isinstance(color, str) and background and not color.startswith("bg_"):
+            color_key = f"bg_{color}"
+        else:
+            color_key = color
         
         if color_key in color_dict:
             return str(color_dict[color_key])
@@ -180,10 +930,10 @@ class Vargula:
         
         if isinstance(color, str) and color.startswith('#'):
             r, g, b = self._hex_to_rgb(color)
-            return self._rgb_to_ansi(r, g, b, background)
+            return self._rgb_to_ansi(r, g, b, background, depth)
         
         if isinstance(color, (tuple, list)) and len(color) == 3:
-            return self._rgb_to_ansi(*color, background)
+            return self._rgb_to_ansi(*color, background, depth)
         
         return None
     
@@ -225,6 +975,36 @@ class Vargula:
         """Check if styling is enabled."""
         return self._enabled
     
+    @staticmethod
+    def _check_color_depth(depth: int) -> int:
+        if depth not in COLOR_DEPTHS:
+            raise ValueError(f"Invalid color depth: {depth}. Use one of {COLOR_DEPTHS}")
+        return depth
+    
+    def set_color_depth(self, depth: Optional[int]):
+        """Set the color depth used for hex and RGB colors.
+        
+        Styles already created are re-resolved at the new depth.
+        
+        Args:
+            depth: 24 (true color), 8 (xterm-256), 4 (16 ANSI colors), or None
+                  to read COLORTERM and TERM again
+            
+        Example:
+            >>> vg.set_color_depth(8)
+            >>> vg.style("Hi", color="#ff8800")  # emits 38;5;208
+        """
+        depth = self._check_color_depth(_detect_color_depth(refresh=True) if depth is None else depth)
+        with self._lock:
+            if depth == self._color_depth:
+                return
+            self._color_depth = depth
+            self._update_styles(set(self._custom_styles) | set(self._current_theme))
+    
+    def get_color_depth(self) -> int:
+        """Return the color depth in bits (24, 8 or 4)."""
+        return self._color_depth
+    
     def style(self, text: str, color=None, bg=None, look=None) -> str:
         """Apply color, background, and/or look to text.
         
@@ -245,24 +1025,7 @@ class Vargula:
         if not self._enabled:
             return text
         
-        codes = []
-        
-        fg_code = self._parse_color(color, background=False)
-        if fg_code:
-            codes.append(fg_code)
-        
-        bg_code = self._parse_color(bg, background=True)
-        if bg_code:
-            codes.append(bg_code)
-        
-        if look:
-            if isinstance(look, str) and look in LOOKS:
-                codes.append(str(LOOKS[look]))
-            elif isinstance(look, (list, tuple)):
-                for l in look:
-                    if l in LOOKS:
-                        codes.append(str(LOOKS[l]))
-        
+        codes = self._collect_style_codes(color, bg, look)
         if not codes:
             return text
         
@@ -285,6 +1048,12 @@ class Vargula:
             >>> vg.create("error", color="red", look="bold")
             >>> vg.create("success", color="#2ecc71")
         """
+        with self._lock:
+            self._define_style(name, color=color, bg=bg, look=look)
+            self._update_styles((name,))
+    
+    def _define_style(self, name: str, color=None, bg=None, look=None):
+        """Validate and store a custom style definition without updating the registry."""
         if not name:
             raise ValueError("Style name cannot be empty")
         
@@ -302,9 +1071,11 @@ class Vargula:
         Returns:
             True if style was deleted, False if not found
         """
-        if name in self._custom_styles:
-            del self._custom_styles[name]
-            return True
+        with self._lock:
+            if name in self._custom_styles:
+                del self._custom_styles[name]
+                self._update_styles((name,))
+                return True
         return False
     
     @staticmethod
@@ -317,7 +1088,9 @@ class Vargula:
         Returns:
             Text without tags
         """
-        return re.sub(r'</?[\w_#-]+>', '', text)
+        if '<' not in text:
+            return text
+        return _STRIP_TAGS.sub('', text)
     
     @staticmethod
     def clean(text: str) -> str:
@@ -329,8 +1102,9 @@ class Vargula:
         Returns:
             Plain text without ANSI codes
         """
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        if '\x1b' not in text:
+            return text
+        return _ANSI_ESCAPE.sub('', text)
     
     @staticmethod
     def length(text: str) -> int:
@@ -342,7 +1116,43 @@ class Vargula:
         Returns:
             Visible character count
         """
-        return len(Vargula.clean(text))
+        if '\x1b' not in text:
+            return len(text)
+        # Subtract the escape spans instead of building a stripped copy; the
+        # escapes are a small fraction of the text and are collected in C.
+        # Summing match spans or scanning for ESC by hand allocates a match
+        # object per escape and is 2-4x slower, short styled cells included.
+        return len(text) - len("".join(_ANSI_ESCAPE.findall(text)))
+    
+    @staticmethod
+    def width(text: str) -> int:
+        """Calculate the display width of text in terminal cells (ignoring ANSI codes).
+        
+        East Asian wide and fullwidth characters and emoji take two cells, while
+        combining marks, zero-width joiner sequences and variation selectors
+        take none. ASCII text is measured like length(); widths of other
+        strings are cached.
+        
+        Args:
+            text: Text possibly containing ANSI codes
+            
+        Returns:
+            Number of terminal cells
+            
+        Example:
+            >>> Vargula.width("日本")
+            4
+        """
+        if text.isascii():
+            return Vargula.length(text)
+        
+        width = _width_cache.get(text)
+        if width is None:
+            plain = _ANSI_ESCAPE.sub('', text) if '\x1b' in text else text
+            width = sum(_cell_widths(plain))
+            if len(text) <= FORMAT_CACHE_MAX_TEXT:
+                _width_cache.put(text, width)
+        return width
     
     def set_theme(self, theme):
         """Set a theme with predefined styles.
@@ -380,10 +1190,30 @@ class Vargula:
             else:
                 raise ValueError(f"Unknown theme: {theme}")
         
-        self._current_theme = theme
+        self._install_theme(theme, register_styles=True)
+    
+    def _install_theme(self, theme: Dict, register_styles: bool):
+        """Make theme current, optionally defining its styles, and publish one snapshot.
         
-        for name, style_def in theme.items():
-            self.create(name, **style_def)
+        If any entry is rejected, the previous theme, custom styles and
+        registry are restored before the error propagates.
+        """
+        with self._lock:
+            previous = self._current_theme
+            custom_styles = dict(self._custom_styles)
+            registry = self._registry
+            try:
+                self._current_theme = theme
+                if register_styles:
+                    for name, style_def in theme.items():
+                        self._define_style(name, **style_def)
+                self._update_styles(set(previous) | set(theme))
+            except BaseException:
+                self._current_theme = previous
+                self._custom_styles.clear()
+                self._custom_styles.update(custom_styles)
+                self._registry = registry
+                raise
     
     @contextmanager
     def temporary(self, name: str, color=None, bg=None, look=None):
@@ -430,123 +1260,320 @@ class Vargula:
             >>> vg.create("error", color="red", look="bold")
             >>> vg.format("<error>Error:</error> Something went wrong")
             >>> vg.format("<#FF5733>Custom hex color</#FF5733>")
+            >>> raw = "<red>a\\x1b[0mb</red>"
+            >>> Vargula(True, delta_sgr=True).format(raw) == Vargula(True).format(raw)
+            True
         """
         if not self._enabled:
             return self.strip(text)
         
-        ESCAPE_PLACEHOLDER = "\x00ESCAPED_LT\x00"
-        ESCAPE_GT_PLACEHOLDER = "\x00ESCAPED_GT\x00"
-        text = text.replace(r'\<', ESCAPE_PLACEHOLDER)
-        text = text.replace(r'\>', ESCAPE_GT_PLACEHOLDER)
-        
-        all_styles = {**self._predefined_styles, **self._current_theme, **self._custom_styles}
-        
-        def find_close_tag(text, start_pos, tag_name):
-            """Find matching closing tag position, accounting for nesting."""
-            open_tag = f"<{tag_name}>"
-            close_tag = f"</{tag_name}>"
-            depth = 1
-            i = start_pos
-            
-            while i < len(text) and depth > 0:
-                if text[i:i + len(open_tag)] == open_tag:
-                    depth += 1
-                    i += len(open_tag)
-                elif text[i:i + len(close_tag)] == close_tag:
-                    depth -= 1
-                    if depth == 0:
-                        return i
-                    i += len(close_tag)
-                else:
-                    i += 1
-            
-            return -1
-        
-        def collect_style_codes(color=None, bg=None, look=None):
-            """Collect ANSI codes without wrapping text."""
-            codes = []
-            
-            fg_code = self._parse_color(color, background=False)
-            if fg_code:
-                codes.append(fg_code)
-            
-            bg_code = self._parse_color(bg, background=True)
-            if bg_code:
-                codes.append(bg_code)
-            
-            if look:
-                if isinstance(look, str) and look in LOOKS:
-                    codes.append(str(LOOKS[look]))
-                elif isinstance(look, (list, tuple)):
-                    for l in look:
-                        if l in LOOKS:
-                            codes.append(str(LOOKS[l]))
-            
-            return codes
-        
-        def process_text(text, inherited_codes=None):
-            """Process text and handle nested tags with inherited styles."""
-            if inherited_codes is None:
-                inherited_codes = []
-            
-            result = []
-            i = 0
-            
-            while i < len(text):
-                if text[i] == '<' and i + 1 < len(text) and text[i + 1] != '/':
-                    match = re.match(r'<(@?#?[\w_#-]+)>', text[i:])
-                    if match:
-                        tag_name = match.group(1)
-                        content_start = i + match.end()
-                        close_pos = find_close_tag(text, content_start, tag_name)
-                        
-                        is_hex_fg = tag_name.startswith('#')
-                        is_hex_bg = tag_name.startswith('@#')
-                        is_named_bg = tag_name.startswith('@') and not is_hex_bg
-                        is_named_style = tag_name in all_styles
-                        
-                        if close_pos != -1 and (is_hex_fg or is_hex_bg or is_named_bg or is_named_style):
-                            if is_hex_fg:
-                                new_codes = collect_style_codes(color=tag_name)
-                            elif is_hex_bg:
-                                bg_color = '#' + tag_name[2:]
-                                new_codes = collect_style_codes(bg=bg_color)
-                            elif is_named_bg:
-                                color_name = tag_name[1:]
-                                new_codes = collect_style_codes(bg=color_name)
-                            else:
-                                style_def = all_styles[tag_name]
-                                new_codes = collect_style_codes(
-                                    color=style_def.get("color"),
-                                    bg=style_def.get("bg"),
-                                    look=style_def.get("look")
-                                )
-                            
-                            combined_codes = inherited_codes + new_codes
-                            inner_text = text[content_start:close_pos]
-                            processed_inner = process_text(inner_text, combined_codes)
-                            
-                            if combined_codes:
-                                styled = f"\033[{';'.join(combined_codes)}m{processed_inner}\033[0m"
-                                if inherited_codes:
-                                    styled += f"\033[{';'.join(inherited_codes)}m"
-                            else:
-                                styled = processed_inner
-                            
-                            result.append(styled)
-                            i = close_pos + len(f"</{tag_name}>")
-                            continue
-                
-                result.append(text[i])
-                i += 1
+        if '<' not in text and '\\>' not in text:
+            return text
+        
+        return self._format_with(self._registry, text)
+    
+    def _format_with(self, registry: _StyleRegistry, text: str) -> str:
+        """Format markup against one registry snapshot, using its cache."""
+        cacheable = len(text) <= FORMAT_CACHE_MAX_TEXT
+        if cacheable:
+            segments = registry.format_cache.get(text)
+            if segments is not None:
+                return "".join(segments)
+        
+        segments = self._compile_markup(text, registry.styles)
+        if cacheable:
+            registry.format_cache.put(text, segments)
+        return "".join(segments)
+    
+    @staticmethod
+    def _style_markup(style_str: str, text: str) -> str:
+        """Wrap text in one tag per word of a style string such as "bold cyan"."""
+        result = text
+        for s in reversed(style_str.strip().split()):
+            result = f"<{s}>{result}</{s}>"
+        return result
+    
+    def _apply_style(self, text: str, style_str: str) -> str:
+        """Apply a style string such as "bold cyan" to text, as tables and progress bars do.
+        
+        The style string is rendered once into the ANSI prefix and suffix that
+        format() puts around plain text, and later calls just concatenate.
+        Text that format() would treat specially (markup, escapes, embedded
+        ANSI codes in delta mode, empty text) still goes through format().
+        """
+        if not style_str:
+            return text
+        if not self._enabled:
+            return self.strip(text)
+        if (not text or '<' in text or '\\>' in text
+                or (self._delta_sgr and '\x1b' in text)):
+            return self.format(self._style_markup(style_str, text))
+        
+        registry = self._registry
+        affixes = registry.affix_cache.get(style_str)
+        if affixes is None:
+            rendered = self._format_with(registry, self._style_markup(style_str, "\x00"))
+            prefix, _, suffix = rendered.partition("\x00")
+            affixes = (prefix, suffix)
+            registry.affix_cache.put(style_str, affixes)
+        return affixes[0] + text + affixes[1]
+    
+    def _format_encoded(self, text: str, encoding: str) -> bytes:
+        """Format and encode markup, caching the bytes once the markup repeats.
+        
+        Encoded output is kept in the registry snapshot next to the compiled
+        segments it was joined from. Markup seen for the first time is compiled
+        and encoded without touching the bytes cache, so one-off lines cost no
+        more than format(text).encode() and do not evict repeated markup.
+        """
+        if (not self._enabled or len(text) > FORMAT_CACHE_MAX_TEXT
+                or ('<' not in text and '\\>' not in text)):
+            return self.format(text).encode(encoding)
+        
+        registry = self._registry
+        key = (text, encoding)
+        data = registry.bytes_cache.get(key)
+        if data is not None:
+            return data
+        segments = registry.format_cache.get(text)
+        if segments is None:
+            segments = self._compile_markup(text, registry.styles)
+            registry.format_cache.put(text, segments)
+            return "".join(segments).encode(encoding)
+        data = "".join(segments).encode(encoding)
+        registry.bytes_cache.put(key, data)
+        return data
+    
+    def format_bytes(self, text: str, encoding: str = "utf-8") -> bytes:
+        """Format markup and return the encoded bytes.
+        
+        Markup that repeats is neither parsed nor encoded again; its encoded
+        form is cached alongside the compiled markup.
+        
+        Args:
+            text: Text with markup tags
+            encoding: Output encoding
+            
+        Returns:
+            Formatted text with ANSI codes, encoded
             
-            return ''.join(result)
+        Example:
+            >>> vg = Vargula()
+            >>> sys.stdout.buffer.write(vg.format_bytes("<red>Error</red>\\n"))
+        """
+        return self._format_encoded(text, encoding)
+    
+    def format_into(self, buffer: bytearray, text: str, encoding: str = "utf-8") -> int:
+        """Format markup and append the encoded bytes to a caller-supplied buffer.
         
-        formatted = process_text(text)
-        formatted = formatted.replace(ESCAPE_PLACEHOLDER, '<')
-        formatted = formatted.replace(ESCAPE_GT_PLACEHOLDER, '>')
+        Args:
+            buffer: bytearray to extend in place
+            text: Text with markup tags
+            encoding: Output encoding
+            
+        Returns:
+            Number of bytes appended
+            
+        Example:
+            >>> vg = Vargula()
+            >>> buf = bytearray()
+            >>> for line in lines:
+            ...     vg.format_into(buf, line)
+            ...     buf += b"\\n"
+            >>> sock.sendall(buf)
+        """
+        data = self._format_encoded(text, encoding)
+        buffer += data
+        return len(data)
+    
+    def format_cache_info(self) -> Dict[str, int]:
+        """Return hit/miss statistics of the compiled markup cache.
         
-        return formatted
+        Returns:
+            Dictionary with "hits", "misses", "maxsize" and "currsize" keys
+            
+        Example:
+            >>> vg = Vargula()
+            >>> vg.format("<red>x</red>"); vg.format("<red>x</red>")
+            >>> vg.format_cache_info()["hits"]
+            1
+        """
+        return self._registry.format_cache.info()
+    
+    def clear_format_cache(self):
+        """Drop all compiled markup cached by format()."""
+        registry = self._registry
+        for name in ("format_cache", "bytes_cache"):
+            cache = registry.existing_cache(name)
+            if cache is not None:
+                cache.clear()
+    
+    @staticmethod
+    def sgr_cache_info() -> Dict[str, int]:
+        """Return hit/miss statistics of the shared color-to-SGR cache.
+        
+        The cache is shared by all instances and bounded by SGR_CACHE_SIZE,
+        so memory stays capped however many distinct colors are styled.
+        
+        Returns:
+            Dictionary with "hits", "misses", "maxsize" and "currsize" keys
+        """
+        return _sgr_cache.info()
+    
+    @staticmethod
+    def clear_sgr_cache():
+        """Drop all cached color-to-SGR resolutions."""
+        _sgr_cache.clear()
+    
+    def _collect_style_codes(self, color=None, bg=None, look=None) -> List[str]:
+        """Collect ANSI codes for a style definition without wrapping text."""
+        codes = []
+        
+        fg_code = self._parse_color(color, background=False)
+        if fg_code:
+            codes.append(fg_code)
+        
+        bg_code = self._parse_color(bg, background=True)
+        if bg_code:
+            codes.append(bg_code)
+        
+        if look:
+            if isinstance(look, str) and look in LOOKS:
+                codes.append(str(LOOKS[look]))
+            elif isinstance(look, (list, tuple)):
+                for l in look:
+                    if l in LOOKS:
+                        codes.append(str(LOOKS[l]))
+        
+        return codes
+    
+    def _tag_codes(self, tag_name: str, styles: Dict[str, Tuple[str, ...]]) -> Optional[Tuple[str, ...]]:
+        """Resolve a markup tag name to ANSI codes, or None if it is not a style tag."""
+        if tag_name.startswith('#'):
+            return tuple(self._collect_style_codes(color=tag_name))
+        if tag_name.startswith('@#'):
+            return tuple(self._collect_style_codes(bg='#' + tag_name[2:]))
+        if tag_name.startswith('@'):
+            return tuple(self._collect_style_codes(bg=tag_name[1:]))
+        return styles.get(tag_name)
+    
+    def _compile_markup(self, text: str, styles: Dict[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+        """Compile markup into the sequence of literal and ANSI segments format() joins.
+        
+        The text is tokenized once with a single regex scan. A first pass pairs
+        opening and closing tags with a stack, so every token is pushed and popped
+        at most once; a second pass emits the segments. Unmatched or unknown tags
+        are kept as literal text. Work is linear in the size of input and output.
+        """
+        tokens = list(_MARKUP_TOKEN.finditer(text))
+        
+        # Pass 1: pair style tags. Only known style tags take part in matching.
+        tag_codes = {}
+        closes = {}
+        stack = []
+        open_counts = {}
+        for index, token in enumerate(tokens):
+            tag_name = token.group(3)
+            if tag_name is None:
+                continue
+            if not token.group(2):
+                codes = self._tag_codes(tag_name, styles)
+                if codes is not None:
+                    tag_codes[index] = codes
+                    stack.append((index, tag_name))
+                    open_counts[tag_name] = open_counts.get(tag_name, 0) + 1
+            elif open_counts.get(tag_name):
+                while True:
+                    open_index, open_name = stack.pop()
+                    open_counts[open_name] -= 1
+                    if open_name == tag_name:
+                        break
+                    del tag_codes[open_index]
+                closes[index] = open_index
+        for open_index, _ in stack:
+            del tag_codes[open_index]
+        
+        # Delta output assumes it owns the terminal state, which literal
+        # escape codes in the text would change behind its back
+        if self._delta_sgr and '\x1b' not in text:
+            return self._emit_delta_segments(text, tokens, tag_codes, closes)
+        
+        # Pass 2: emit literal runs and ANSI codes for matched pairs.
+        segments = []
+        active = []
+        pos = 0
+        for index, token in enumerate(tokens):
+            start = token.start()
+            if start > pos:
+                segments.append(text[pos:start])
+            pos = token.end()
+            
+            escaped = token.group(1)
+            if escaped:
+                segments.append(escaped)
+            elif index in tag_codes:
+                inherited_codes = active[-1][0] if active else ()
+                combined_codes = inherited_codes + tag_codes[index]
+                active.append((combined_codes, inherited_codes))
+                if combined_codes:
+                    segments.append(f"\033[{';'.join(combined_codes)}m")
+            elif index in closes:
+                combined_codes, inherited_codes = active.pop()
+                if combined_codes:
+                    segments.append("\033[0m")
+                    if inherited_codes:
+                        segments.append(f"\033[{';'.join(inherited_codes)}m")
+            else:
+                segments.append(token.group(0))
+        if pos < len(text):
+            segments.append(text[pos:])
+        
+        return tuple(segments)
+    
+    @staticmethod
+    def _emit_delta_segments(text: str, tokens, tag_codes, closes) -> Tuple[str, ...]:
+        """Emit segments that only switch the SGR attributes that change.
+        
+        The attribute state of the terminal is tracked across spans. Pending
+        changes are written just before the next visible text, so adjacent tag
+        boundaries collapse into one escape sequence and repeated codes vanish.
+        The text must not contain escape codes of its own.
+        """
+        segments = []
+        states = [_EMPTY_SGR_STATE]
+        terminal = _EMPTY_SGR_STATE
+        pos = 0
+        
+        def emit(literal):
+            nonlocal terminal
+            if terminal != states[-1]:
+                params = _sgr_transition(terminal, states[-1])
+                if params:
+                    segments.append(f"\033[{params}m")
+                terminal = states[-1]
+            segments.append(literal)
+        
+        for index, token in enumerate(tokens):
+            start = token.start()
+            if start > pos:
+                emit(text[pos:start])
+            pos = token.end()
+            
+            escaped = token.group(1)
+            if escaped:
+                emit(escaped)
+            elif index in tag_codes:
+                states.append(_sgr_apply(states[-1], tag_codes[index]))
+            elif index in closes:
+                states.pop()
+            else:
+                emit(token.group(0))
+        if pos < len(text):
+            emit(text[pos:])
+        if terminal != _EMPTY_SGR_STATE:
+            segments.append("\033[0m")
+        
+        return tuple(segments)
     
     def write(self, *args, sep=" ", end="\n", file=None, flush=False):
         """Print formatted text with markup-style tags (works like built-in print()).
@@ -569,6 +1596,27 @@ class Vargula:
         formatted_args = [self.format(str(arg)) for arg in args]
         output = sep.join(formatted_args)
         print(output, end=end, file=file, flush=flush)
+    
+    def compile(self, markup: str, encoding: str = "utf-8") -> '_Template':
+        """Precompile a markup template with str.format-style fields.
+        
+        The markup is parsed once and the ANSI codes of every span are baked
+        into the template. Calling the template only substitutes the field
+        values, which are inserted verbatim and never parsed as markup.
+        
+        Args:
+            markup: Markup text with {field} placeholders outside tag names
+            encoding: Encoding used by the template's bytes output methods
+            
+        Returns:
+            Callable template object
+            
+        Example:
+            >>> vg = Vargula()
+            >>> line = vg.compile("<dim>{ts}</dim> <error>{msg}</error>")
+            >>> print(line(ts="10:30:45", msg="a < b"))
+        """
+        return self._Template(vargula=self, markup=markup, encoding=encoding)
 
     # ============================================
     # Color Manipulation Methods
@@ -1107,11 +2155,7 @@ class Vargula:
         for name, color in palette.items():
             theme_styles[name] = {"color": color, "bg": None, "look": None}
         
-        self._current_theme = theme_styles
-        
-        if register_styles:
-            for name, style_def in theme_styles.items():
-                self.create(name, **style_def)
+        self._install_theme(theme_styles, register_styles)
     
     # ============================================
     # Persistence Methods
@@ -1205,10 +2249,31 @@ class Vargula:
         padding: Tuple[int, int] = (0, 1),
         expand: bool = False,
         min_width: int = None,
-        box: str = "rounded"
+        box: str = "rounded",
+        storage: str = "rows",
+        live: bool = False,
+        width_strategy: str = "exact",
+        sample_size: int = 1000,
+        percentile: float = 95
     ) -> '_Table':
         """Create a rich-style table with customizable styling and borders.
         
+        Use storage="columns" for very large tables: cells are kept in one list
+        per column with compact arrays of widths and row-style ids instead of a
+        dict and lists per row. table.rows is then a read-only view.
+        
+        Use live=True for tables redrawn in place with table.refresh(): rendered
+        rows are cached and only rows changed since the last refresh are
+        repainted.
+        
+        width_strategy controls how column widths are measured. "exact" uses
+        every row. "sample" uses the first sample_size rows, and "reservoir"
+        the given percentile of cell widths in a random sample of sample_size
+        rows, so a few very long cells do not widen the whole column. Wider
+        cells are cut by the column's overflow setting. Rows streamed through
+        iter_lines(rows=...) are sampled from their first sample_size rows, so
+        output starts after those rows instead of needing fixed widths.
+        
         Example:
             >>> vg = Vargula()
             >>> table = vg.Table(title="Users", style="cyan")
@@ -1231,7 +2296,12 @@ class Vargula:
             padding=padding,
             expand=expand,
             min_width=min_width,
-            box=box
+            box=box,
+            storage=storage,
+            live=live,
+            width_strategy=width_strategy,
+            sample_size=sample_size,
+            percentile=percentile
         )
     
     def ProgressBar(
@@ -1249,10 +2319,18 @@ class Vargula:
         show_rate: bool = True,
         show_eta: bool = True,
         bar_format: str = None,
-        refresh_rate: float = 0.1
+        refresh_rate: float = 0.1,
+        miniters: int = None,
+        maxinterval: float = 10.0
     ) -> '_ProgressBar':
         """Create a rich-style progress bar with customizable appearance.
         
+        update() only reads the clock every miniters steps. By default
+        miniters is tuned from a smoothed rate so the clock is checked about
+        once per refresh_rate seconds, growing at most 2x per check; pass an
+        integer to fix it. If the rate drops, a monitor thread resets an
+        adaptive miniters once no redraw has happened for maxinterval seconds.
+        
         Example:
             >>> vg = Vargula()
             >>> with vg.ProgressBar(total=100, desc="Processing") as pbar:
@@ -1275,7 +2353,9 @@ class Vargula:
             show_rate=show_rate,
             show_eta=show_eta,
             bar_format=bar_format,
-            refresh_rate=refresh_rate
+            refresh_rate=refresh_rate,
+            miniters=miniters,
+            maxinterval=maxinterval
         )
     
     def MultiProgress(self) -> '_MultiProgress':
@@ -1293,6 +2373,160 @@ class Vargula:
         """
         return self._MultiProgress(vargula=self)
     
+    def Console(
+        self,
+        file=None,
+        buffer_size: int = 65536,
+        max_lines: int = None,
+        flush_interval: float = None
+    ) -> '_Console':
+        """Create a buffered writer that batches formatted output.
+        
+        Output still buffered when the console is garbage collected or the
+        interpreter exits is flushed then. flush_interval is checked on each
+        write, so call flush() before going idle.
+        
+        Example:
+            >>> vg = Vargula()
+            >>> with vg.Console(max_lines=1000) as console:
+            ...     for i in range(100000):
+            ...         console.write(f"<green>ok</green> item {i}")
+        """
+        return self._Console(
+            vargula=self,
+            file=file,
+            buffer_size=buffer_size,
+            max_lines=max_lines,
+            flush_interval=flush_interval
+        )
+    
+    def AsyncConsole(
+        self,
+        writer=None,
+        file=None,
+        high_water: int = 65536,
+        offload_threshold: int = None,
+        encoding: str = "utf-8"
+    ) -> '_AsyncConsole':
+        """Create an asyncio writer that queues formatted output off the event loop.
+        
+        Example:
+            >>> vg = Vargula()
+            >>> async def handler(writer):
+            ...     async with vg.AsyncConsole(writer) as console:
+            ...         console.write("<green>ok</green> request served")
+            ...         await console.awrite("<red>slow</red> upstream")
+        """
+        return self._AsyncConsole(
+            vargula=self,
+            writer=writer,
+            file=file,
+            high_water=high_water,
+            offload_threshold=offload_threshold,
+            encoding=encoding
+        )
+    
+    # ============================================
+    # _Template Class (Inner - Private)
+    # ============================================
+    
+    class _Template:
+        """Markup template compiled once and filled with plain field values.
+        
+        Access via vg.compile() method.
+        """
+        
+        def __init__(self, vargula: 'Vargula', markup: str, encoding: str = "utf-8"):
+            """Initialize a template."""
+            self.vg = vargula
+            self.markup = markup
+            self.encoding = encoding
+            
+            self._fmt = ""
+            self._parts = None
+            self._version = None
+            self._enabled = None
+            self._compile()
+        
+        def _compile(self):
+            """Render the markup into a str.format pattern with ANSI codes inlined.
+
+            The pattern and its version come from one registry snapshot, so a
+            concurrent create() or set_theme() triggers a later recompile.
+            """
+            registry = self.vg._registry
+            enabled = self.vg._enabled
+            markup = self.markup
+            if not enabled:
+                fmt = self.vg.strip(markup)
+            elif '<' not in markup and '\\>' not in markup:
+                fmt = markup
+            else:
+                fmt = self.vg._format_with(registry, markup)
+            self._fmt = fmt
+            self._parts = None
+            self._version = registry.version
+            self._enabled = enabled
+        
+        def _check(self):
+            """Recompile if the style registry or enabled state has changed."""
+            if self._version != self.vg._registry.version or self._enabled != self.vg._enabled:
+                self._compile()
+        
+        def _encoded_parts(self) -> List:
+            """Split the pattern into pre-encoded literal bytes and per-field patterns."""
+            parts = []
+            auto_index = 0
+            for literal, field, spec, conversion in Formatter().parse(self._fmt):
+                if literal:
+                    parts.append(literal.encode(self.encoding))
+                if field is not None:
+                    if field == "":
+                        field = str(auto_index)
+                        auto_index += 1
+                    conversion = f"!{conversion}" if conversion else ""
+                    spec = f":{spec}" if spec else ""
+                    parts.append(f"{{{field}{conversion}{spec}}}")
+            return parts
+        
+        def format(self, *args, **kwargs) -> str:
+            """Fill the template fields and return the styled text."""
+            self._check()
+            return self._fmt.format(*args, **kwargs)
+        
+        __call__ = format
+        
+        def format_into(self, buffer: bytearray, *args, **kwargs) -> int:
+            """Fill the template fields and append the encoded result to buffer.
+            
+            Literal text and ANSI codes are encoded once per compilation; only
+            the field values are encoded on each call.
+            
+            Returns:
+                Number of bytes appended
+            """
+            self._check()
+            parts = self._parts
+            if parts is None:
+                parts = self._parts = self._encoded_parts()
+            start = len(buffer)
+            encoding = self.encoding
+            for part in parts:
+                if part.__class__ is bytes:
+                    buffer += part
+                else:
+                    buffer += part.format(*args, **kwargs).encode(encoding)
+            return len(buffer) - start
+        
+        def format_bytes(self, *args, **kwargs) -> bytes:
+            """Fill the template fields and return the encoded result."""
+            buffer = bytearray()
+            self.format_into(buffer, *args, **kwargs)
+            return bytes(buffer)
+        
+        def __repr__(self) -> str:
+            return f"<Template {self.markup!r}>"
+    
     # ============================================
     # _Table Class (Inner - Private)
     # ============================================
@@ -1318,9 +2552,25 @@ class Vargula:
             padding: Tuple[int, int] = (0, 1),
             expand: bool = False,
             min_width: int = None,
-            box: str = "rounded"
+            box: str = "rounded",
+            storage: str = "rows",
+            live: bool = False,
+            width_strategy: str = "exact",
+            sample_size: int = 1000,
+            percentile: float = 95
         ):
             """Initialize a table."""
+            if storage not in ("rows", "columns"):
+                raise ValueError(f"Invalid storage: {storage}. Use 'rows' or 'columns'")
+            if width_strategy not in ("exact", "sample", "reservoir"):
+                raise ValueError(
+                    f"Invalid width_strategy: {width_strategy}. Use 'exact', 'sample' or 'reservoir'"
+                )
+            if sample_size < 1:
+                raise ValueError(f"sample_size must be positive, got {sample_size}")
+            if not 0 < percentile <= 100:
+                raise ValueError(f"percentile must be in (0, 100], got {percentile}")
+            
             self.vg = vargula
             self.title = title
             self.caption = caption
@@ -1335,12 +2585,103 @@ class Vargula:
             self.expand = expand
             self.min_width = min_width
             self.box = box
+            self.storage = storage
+            self.width_strategy = width_strategy
+            self.sample_size = sample_size
+            self.percentile = percentile
             
             self.columns = []
-            self.rows = []
+            self._frozen_widths = None
+            self._columnar = storage == "columns"
+            if self._columnar:
+                # Cells live in the columns; rows hold an id into _style_names
+                self.rows = self._RowsView(self)
+                self._row_count = 0
+                self._row_styles = array("H")
+                self._style_names = [None]
+                self._style_ids = {None: 0}
+            else:
+                self.rows = []
+            
+            # Live mode: rendered row and frame lines for the current widths and
+            # styles, rows changed since the last refresh, and what is on screen
+            self.live = live
+            self._live_key = None
+            self._row_lines = {}
+            self._frame_lines = {}
+            self._dirty = set()
+            self._painted_rows = 0
+            self._painted_lines = None
             
             self._box_chars = self._get_box_chars(box)
         
+        class _Column:
+            """Column settings and width statistics, plus the cells in columnar storage."""
+            
+            __slots__ = (
+                "header", "style", "justify", "no_wrap", "overflow", "width", "min_width",
+                "max_width", "actual_width", "header_width", "content_width", "width_counts",
+                "cells", "widths",
+            )
+            
+            def __init__(self, header, style, justify, no_wrap, overflow, width,
+                         min_width, max_width, header_width):
+                self.header = header
+                self.style = style
+                self.justify = justify
+                self.no_wrap = no_wrap
+                self.overflow = overflow
+                self.width = width
+                self.min_width = min_width
+                self.max_width = max_width
+                self.actual_width = width or header_width
+                self.header_width = header_width
+                # Widest cell so far, and how many cells have each width so the
+                # maximum can be restored when the widest cell is updated
+                self.content_width = 0
+                self.width_counts = {}
+                self.cells = None
+                self.widths = None
+            
+            # Dict-style access, as columns were plain dicts before
+            def __getitem__(self, key: str):
+                if key not in self.__slots__:
+                    raise KeyError(key)
+                return getattr(self, key)
+            
+            def __setitem__(self, key: str, value):
+                if key not in self.__slots__:
+                    raise KeyError(key)
+                setattr(self, key, value)
+            
+            def get(self, key: str, default=None):
+                return getattr(self, key) if key in self.__slots__ else default
+        
+        class _RowsView:
+            """Read-only sequence of row dicts built on access from columnar storage."""
+            
+            __slots__ = ("_table",)
+            
+            def __init__(self, table: 'Vargula._Table'):
+                self._table = table
+            
+            def __len__(self) -> int:
+                return self._table._row_count
+            
+            def __getitem__(self, index):
+                if isinstance(index, slice):
+                    return [self[i] for i in range(*index.indices(len(self)))]
+                if index < 0:
+                    index += len(self)
+                if not 0 <= index < len(self):
+                    raise IndexError("row index out of range")
+                cells, widths, style = self._table._row_at(index)
+                return {"cells": list(cells), "style": style, "widths": list(widths)}
+            
+            def __iter__(self):
+                for index in range(len(self)):
+                    yield self[index]
+        
         def _get_box_chars(self, box_type: str) -> Dict[str, str]:
             """Get box drawing characters for border style."""
             boxes = {
@@ -1389,22 +2730,25 @@ class Vargula:
             max_width: int = None
         ):
             """Add a column to the table."""
-            header_length = Vargula.length(header)
-            
-            self.columns.append({
-                "header": header,
-                "style": style,
-                "justify": justify,
-                "no_wrap": no_wrap,
-                "overflow": overflow,
-                "width": width,
-                "min_width": min_width or header_length,
-                "max_width": max_width,
-                "actual_width": width or header_length
-            })
-            
-            for row in self.rows:
-                row["cells"].append("")
+            header_length = Vargula.width(header)
+            
+            col = self._Column(
+                header, style, justify, no_wrap, overflow, width,
+                min_width or header_length, max_width, header_length
+            )
+            n_rows = len(self.rows)
+            if n_rows:
+                col.width_counts[0] = n_rows
+            self.columns.append(col)
+            self._frozen_widths = None
+            
+            if self._columnar:
+                col.cells = [""] * n_rows
+                col.widths = array("I", bytes(4 * n_rows))
+            else:
+                for row in self.rows:
+                    row["cells"].append("")
+                    row["widths"].append(0)
         
         def add_row(self, *cells, style: str = None):
             """Add a row of data to the table."""
@@ -1414,55 +2758,312 @@ class Vargula:
             elif len(cells_list) > len(self.columns):
                 raise ValueError(f"Too many cells: expected {len(self.columns)}, got {len(cells_list)}")
             
-            self.rows.append({"cells": cells_list, "style": style})
+            widths = [Vargula.width(str(cell)) for cell in cells_list]
+            for col, cell_width in zip(self.columns, widths):
+                self._count_width(col, cell_width)
+            
+            if self._columnar:
+                for col, cell, cell_width in zip(self.columns, cells_list, widths):
+                    col.cells.append(cell)
+                    col.widths.append(cell_width)
+                self._row_styles.append(self._style_id(style))
+                self._row_count += 1
+            else:
+                self.rows.append({"cells": cells_list, "style": style, "widths": widths})
+        
+        def add_rows(self, rows, style: str = None, formats: Optional[Dict] = None) -> int:
+            """Add many rows at once.
+            
+            Rows are transposed into columns so formatting and width
+            measurement run once per column instead of once per cell. Short
+            rows are padded with empty cells, which formats are not applied to.
+            
+            Args:
+                rows: Iterable of row sequences (e.g. a query result), or a
+                    2-D buffer with a tolist() method such as a NumPy array
+                style: Style applied to every added row
+                formats: Per-column format, keyed by header (or by column
+                    index when no header matches). Either a format spec such
+                    as ",.2f" or a callable.
+                    
+            Returns:
+                Number of rows added
+                
+            Example:
+                >>> table = vg.Table()
+                >>> table.add_column("Item"); table.add_column("Price")
+                >>> table.add_rows([("apple", 1234.5), ("pear",)], formats={"Price": ",.2f"})
+                2
+            """
+            if hasattr(rows, "tolist"):
+                rows = rows.tolist()
+            rows = rows if isinstance(rows, list) else list(rows)
+            n_columns = len(self.columns)
+            
+            lengths = set(map(len, rows))
+            if lengths and max(lengths) > n_columns:
+                raise ValueError(f"Too many cells: expected {n_columns}, got {max(lengths)}")
+            padded = ()
+            if lengths and min(lengths) < n_columns:
+                pad = (_MISSING,) * n_columns
+                rows = [row if len(row) == n_columns else tuple(row) + pad[len(row):] for row in rows]
+                padded = range(min(lengths), n_columns)
+            
+            values = [list(column) for column in zip(*rows)] if rows else [[] for _ in range(n_columns)]
+            return self._add_column_values(values, len(rows), style, formats, padded)
+        
+        def from_columns(self, data: Dict, style: str = None, formats: Optional[Dict] = None) -> int:
+            """Add rows from a mapping of column header to column values.
+            
+            Columns are created from the keys (as str) when the table has none
+            yet. Values may be any sequence, including array.array, memoryview
+            and NumPy arrays, which are unpacked in one tolist() call. Columns
+            missing from data are filled with empty cells.
+            
+            Args:
+                data: Mapping of header (or column index when no header
+                    matches) to a sequence of cell values
+                style: Style applied to every added row
+                formats: Per-column format, keyed like data. Either a format
+                    spec such as ",.2f" or a callable.
+                    
+            Returns:
+                Number of rows added
+                
+            Example:
+                >>> table = vg.Table()
+                >>> table.from_columns({2023: [1.5, 2], 2024: [2.25, 3]}, formats={2024: ".1f"})
+                2
+            """
+            if not self.columns:
+                for key in data:
+                    self.add_column(str(key))
+            
+            values = [None] * len(self.columns)
+            for key, column in data.items():
+                index = self._column_index(key)
+                if index is None:
+                    raise ValueError(f"Unknown column: {key!r}")
+                values[index] = column.tolist() if hasattr(column, "tolist") else list(column)
+            
+            lengths = {len(column) for column in values if column is not None}
+            if len(lengths) > 1:
+                raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+            n_rows = lengths.pop() if lengths else 0
+            
+            padded = [i for i, column in enumerate(values) if column is None]
+            for i in padded:
+                values[i] = [_MISSING] * n_rows
+            return self._add_column_values(values, n_rows, style, formats, padded)
+        
+        def _column_index(self, key) -> Optional[int]:
+            """Resolve a column key: a header (compared as str) first, then an int index."""
+            header = str(key)
+            for index, col in enumerate(self.columns):
+                if col.header == header:
+                    return index
+            if isinstance(key, int) and 0 <= key < len(self.columns):
+                return key
+            return None
+        
+        def _add_column_values(self, values: List[list], n_rows: int, style: Optional[str],
+                               formats: Optional[Dict], padded=()) -> int:
+            """Format, measure and store one list of values per column.
+            
+            Columns listed in padded may hold _MISSING placeholders, which are
+            skipped by formats and stored as empty cells.
+            """
+            if formats:
+                for key, fmt in formats.items():
+                    index = self._column_index(key)
+                    if index is None:
+                        raise ValueError(f"Unknown column in formats: {key!r}")
+                    formatter = fmt if callable(fmt) else ("{:" + fmt + "}").format
+                    if index in padded:
+                        values[index] = [cell if cell is _MISSING else formatter(cell) for cell in values[index]]
+                    else:
+                        values[index] = list(map(formatter, values[index]))
+            for index in padded:
+                values[index] = ["" if cell is _MISSING else cell for cell in values[index]]
+            
+            width_columns = []
+            for col, column in zip(self.columns, values):
+                widths = self._column_widths(column)
+                counts = col.width_counts
+                for cell_width, count in Counter(widths).items():
+                    counts[cell_width] = counts.get(cell_width, 0) + count
+                if widths:
+                    col.content_width = max(col.content_width, max(widths))
+                width_columns.append(widths)
+            
+            if self._columnar:
+                for col, column, widths in zip(self.columns, values, width_columns):
+                    col.cells.extend(column)
+                    col.widths.extend(widths)
+                self._row_styles.extend(array(self._row_styles.typecode, [self._style_id(style)]) * n_rows)
+                self._row_count += n_rows
+            elif self.columns:
+                self.rows.extend(
+                    {"cells": list(cells), "style": style, "widths": list(widths)}
+                    for cells, widths in zip(zip(*values), zip(*width_columns))
+                )
+            else:
+                self.rows.extend({"cells": [], "style": style, "widths": []} for _ in range(n_rows))
+            return n_rows
+        
+        @staticmethod
+        def _column_widths(column: list) -> List[int]:
+            """Measure every cell of a column, using len() when the column is plain ASCII."""
+            texts = list(map(str, column))
+            joined = "".join(texts)
+            if joined.isascii() and "\x1b" not in joined:
+                return list(map(len, texts))
+            return list(map(Vargula.width, texts))
+        
+        def _style_id(self, style: Optional[str]) -> int:
+            """Return the compact id of a row style, registering new styles."""
+            style_id = self._style_ids.get(style)
+            if style_id is None:
+                style_id = len(self._style_names)
+                self._style_ids[style] = style_id
+                self._style_names.append(style)
+                if style_id > 0xFFFF and self._row_styles.typecode == "H":
+                    self._row_styles = array("I", self._row_styles)
+            return style_id
+        
+        def _row_at(self, row_idx: int):
+            """Return (cells, widths, style) of a stored row."""
+            if self._columnar:
+                return (
+                    [col.cells[row_idx] for col in self.columns],
+                    [col.widths[row_idx] for col in self.columns],
+                    self._style_names[self._row_styles[row_idx]],
+                )
+            row = self.rows[row_idx]
+            return row["cells"], row["widths"], row["style"]
         
         def update_cell(self, row_idx: int, col_idx: int, value: str):
             """Update a specific cell value."""
             if 0 <= row_idx < len(self.rows) and 0 <= col_idx < len(self.columns):
-                self.rows[row_idx]["cells"][col_idx] = value
+                col = self.columns[col_idx]
+                cell_width = Vargula.width(str(value))
+                if self._columnar:
+                    self._discount_width(col, col.widths[row_idx])
+                    col.cells[row_idx] = value
+                    col.widths[row_idx] = cell_width
+                else:
+                    row = self.rows[row_idx]
+                    self._discount_width(col, row["widths"][col_idx])
+                    row["cells"][col_idx] = value
+                    row["widths"][col_idx] = cell_width
+                self._count_width(col, cell_width)
+                if self.live:
+                    self._dirty.add(row_idx)
             else:
                 raise IndexError(f"Cell position ({row_idx}, {col_idx}) out of bounds")
         
-        def _calculate_widths(self, terminal_width: int = 80):
-            """Calculate optimal column widths."""
+        @staticmethod
+        def _count_width(col: '_Column', cell_width: int):
+            """Record a cell width in a column's running maximum."""
+            counts = col.width_counts
+            counts[cell_width] = counts.get(cell_width, 0) + 1
+            if cell_width > col.content_width:
+                col.content_width = cell_width
+        
+        @staticmethod
+        def _discount_width(col: '_Column', cell_width: int):
+            """Forget a cell width, lowering the column maximum if it was the last widest cell."""
+            counts = col.width_counts
+            remaining = counts[cell_width] - 1
+            if remaining:
+                counts[cell_width] = remaining
+                return
+            del counts[cell_width]
+            if cell_width == col.content_width:
+                col.content_width = max(counts, default=0)
+        
+        def _calculate_widths(self, terminal_width: int = 80, content_widths: Optional[List[int]] = None):
+            """Calculate optimal column widths.
+            
+            content_widths overrides the widest cell of each column, e.g. with
+            widths measured on a sample of rows.
+            """
             if not self.columns:
                 return
             
+            if content_widths is None:
+                content_widths = self._sampled_content_widths()
+            if content_widths is None:
+                content_widths = [col.content_width for col in self.columns]
+            
             if self.expand:
                 available = terminal_width - len(self.columns) - 1
             else:
                 available = terminal_width
             
-            for col_idx, col in enumerate(self.columns):
-                if col["width"]:
-                    col["actual_width"] = col["width"]
+            for col, content_width in zip(self.columns, content_widths):
+                if col.width:
+                    col.actual_width = col.width
                 else:
-                    max_content = col["min_width"]
+                    max_content = max(col.min_width, content_width)
                     
-                    if self.rows:
-                        for row in self.rows:
-                            if col_idx < len(row["cells"]):
-                                cell_text = str(row["cells"][col_idx])
-                                cell_length = Vargula.length(cell_text)
-                                max_content = max(max_content, cell_length)
+                    if col.max_width:
+                        max_content = min(max_content, col.max_width)
                     
-                    if col["max_width"]:
-                        max_content = min(max_content, col["max_width"])
-                    
-                    col["actual_width"] = max_content
+                    col.actual_width = max_content
             
-            total = sum(c["actual_width"] for c in self.columns)
+            total = sum(c.actual_width for c in self.columns)
             if self.min_width and total < self.min_width:
                 extra = self.min_width - total
                 per_col = extra // len(self.columns)
                 for col in self.columns:
-                    col["actual_width"] += per_col
+                    col.actual_width += per_col
+        
+        def _sampled_content_widths(self) -> Optional[List[int]]:
+            """Estimate the widest cell of each column from stored rows per width_strategy.
+            
+            Returns None when every row should be measured, i.e. for the exact
+            strategy or a "sample" table no longer than the sample.
+            """
+            n_rows = len(self.rows)
+            if self.width_strategy == "exact" or not n_rows:
+                return None
+            if self.width_strategy == "sample":
+                if n_rows <= self.sample_size:
+                    return None
+                indices = range(self.sample_size)
+            elif n_rows <= self.sample_size:
+                indices = range(n_rows)
+            else:
+                # Seeded by the row count so repeated renders pick the same rows
+                indices = sorted(random.Random(n_rows).sample(range(n_rows), self.sample_size))
+            
+            if self._columnar:
+                width_columns = [[col.widths[i] for i in indices] for col in self.columns]
+            else:
+                width_columns = zip(*[self.rows[i]["widths"] for i in indices])
+            return self._estimate_widths(width_columns)
         
-        def _justify_text(self, text: str, width: int, align: str) -> str:
-            """Justify text within given width."""
-            text_len = Vargula.length(text)
-            if text_len >= width:
-                return text[:width]
+        def _estimate_widths(self, width_columns) -> List[int]:
+            """Reduce sampled cell widths per column to a column width estimate.
+            
+            "sample" keeps the widest sampled cell; "reservoir" takes the
+            percentile-th width (nearest rank) so rare outliers are truncated.
+            """
+            if self.width_strategy == "sample":
+                return [max(widths, default=0) for widths in width_columns]
+            
+            estimates = []
+            for widths in width_columns:
+                widths = sorted(widths)
+                rank = int(-(-self.percentile * len(widths) // 100))
+                estimates.append(widths[max(rank, 1) - 1] if widths else 0)
+            return estimates
+        
+        def _justify_text(self, text: str, width: int, align: str, text_len: int) -> str:
+            """Justify text of text_len cells within given width."""
+            if text_len > width:
+                text, text_len = _truncate_width(text, width)
             
             padding = width - text_len
             if align == "center":
@@ -1476,15 +3077,7 @@ class Vargula:
         
         def _apply_style(self, text: str, style_str: str) -> str:
             """Apply a style string to text."""
-            if not style_str:
-                return text
-            
-            styles = style_str.strip().split()
-            result = text
-            for s in reversed(styles):
-                result = f"<{s}>{result}</{s}>"
-            
-            return self.vg.format(result)
+            return self.vg._apply_style(text, style_str)
         
         def _render_border(self, left: str, mid: str, right: str, junction: str) -> str:
             """Render a horizontal border line."""
@@ -1492,7 +3085,7 @@ class Vargula:
             pad_h = self.padding[1]
             
             for i, col in enumerate(self.columns):
-                parts.append(mid * (col["actual_width"] + pad_h * 2))
+                parts.append(mid * (col.actual_width + pad_h * 2))
                 if i < len(self.columns) - 1:
                     parts.append(junction)
             parts.append(right)
@@ -1502,8 +3095,9 @@ class Vargula:
                 return self._apply_style(line, self.border_style)
             return line
         
-        def _render_row(self, cells: List[str], cell_styles: List[str] = None, row_style: str = None) -> str:
-            """Render a single row."""
+        def _render_row(self, cells: List[str], widths: List[int], cell_styles: List[str] = None,
+                        row_style: str = None) -> str:
+            """Render a single row from its cells and their measured widths."""
             parts = []
             v_char = self._box_chars["v"]
             if self.border_style:
@@ -1513,26 +3107,27 @@ class Vargula:
             
             pad_v, pad_h = self.padding
             
-            for i, (cell, col) in enumerate(zip(cells, self.columns)):
+            for i, (cell, col, cell_length) in enumerate(zip(cells, self.columns, widths)):
                 cell_text = str(cell)
                 
-                cell_length = Vargula.length(cell_text)
-                if cell_length > col["actual_width"]:
-                    if col["overflow"] == "ellipsis":
-                        if col["actual_width"] > 0:
-                            cell_text = cell_text[:col["actual_width"]-1] + "…"
+                if cell_length > col.actual_width:
+                    if col.overflow == "ellipsis":
+                        if col.actual_width > 0:
+                            cell_text, cell_length = _truncate_width(cell_text, col.actual_width - 1)
+                            cell_text += "…"
+                            cell_length += 1
                         else:
-                            cell_text = ""
+                            cell_text, cell_length = "", 0
                     else:
-                        cell_text = cell_text[:col["actual_width"]]
+                        cell_text, cell_length = _truncate_width(cell_text, col.actual_width)
                 
-                justified = self._justify_text(cell_text, col["actual_width"], col["justify"])
+                justified = self._justify_text(cell_text, col.actual_width, col.justify, cell_length)
                 
                 styled = justified
                 if cell_styles and i < len(cell_styles) and cell_styles[i]:
                     styled = self._apply_style(justified, cell_styles[i])
-                elif col["style"]:
-                    styled = self._apply_style(justified, col["style"])
+                elif col.style:
+                    styled = self._apply_style(justified, col.style)
                 elif row_style:
                     styled = self._apply_style(justified, row_style)
                 elif self.style:
@@ -1543,64 +3138,449 @@ class Vargula:
             
             return "".join(parts)
         
-        def __str__(self) -> str:
-            """Render the table as a string."""
+        def _iter_rows(self, rows=None, start: int = 0, stop: Optional[int] = None):
+            """Yield (cells, cell widths, row style) for table rows [start:stop] or external rows."""
+            if rows is None:
+                window = slice(start, stop)
+                if self._columnar:
+                    names = self._style_names
+                    yield from zip(
+                        zip(*[col.cells[window] for col in self.columns]),
+                        zip(*[col.widths[window] for col in self.columns]),
+                        (names[style_id] for style_id in self._row_styles[window]),
+                    )
+                else:
+                    for row in self.rows[window]:
+                        yield row["cells"], row["widths"], row["style"]
+                return
+            
+            n_columns = len(self.columns)
+            for cells in rows:
+                cells_list = list(cells)
+                if len(cells_list) < n_columns:
+                    cells_list.extend([""] * (n_columns - len(cells_list)))
+                elif len(cells_list) > n_columns:
+                    raise ValueError(f"Too many cells: expected {n_columns}, got {len(cells_list)}")
+                yield cells_list, [Vargula.width(str(cell)) for cell in cells_list], None
+        
+        def iter_lines(self, rows=None, widths: Optional[List[int]] = None,
+                       start: int = 0, stop: Optional[int] = None):
+            """Render the table lazily, one line at a time.
+            
+            Only one line is held in memory at a time, so exporting a table costs
+            the same memory whatever its number of rows.
+            
+            Args:
+                rows: Iterable of cell sequences to render instead of the table's
+                     own rows (e.g. a generator over a database cursor). Cells are
+                     measured as they stream by and truncated to the column widths.
+                     With a "sample" or "reservoir" width_strategy, the first
+                     sample_size rows are buffered to estimate the widths.
+                widths: Fixed width for each column. If None, the widths set by
+                       freeze_widths() are used, or else widths are computed from
+                       the headers and the rows added to the table.
+                start: First table row to render
+                stop: Row to stop before (None for the last row)
+                       
+            Yields:
+                Rendered lines without trailing newlines
+                
+            Example:
+                >>> for line in table.iter_lines():
+                ...     print(line)
+            """
             if not self.columns:
-                return ""
+                return
             
-            self._calculate_widths()
-            lines = []
+            measured = self._iter_rows(rows, start, stop)
+            if widths is None:
+                widths = self._frozen_widths
+            if widths is None:
+                content_widths = None
+                if rows is not None and self.width_strategy != "exact":
+                    head = list(islice(measured, self.sample_size))
+                    measured = chain(head, measured)
+                    if head:
+                        content_widths = self._estimate_widths(zip(*[row[1] for row in head]))
+                self._calculate_widths(content_widths=content_widths)
+            else:
+                if len(widths) != len(self.columns):
+                    raise ValueError(f"Expected {len(self.columns)} widths, got {len(widths)}")
+                for col, width in zip(self.columns, widths):
+                    col.actual_width = width
             
             if self.title:
                 title_text = self.title
                 if self.title_style:
                     title_text = self._apply_style(title_text, self.title_style)
-                lines.append(title_text)
+                yield title_text
             
-            lines.append(self._render_border(
+            yield self._render_border(
                 self._box_chars["tl"],
                 self._box_chars["h"],
                 self._box_chars["tr"],
                 self._box_chars["tt"]
-            ))
+            )
+            
+            separator = self._render_border(
+                self._box_chars["lt"],
+                self._box_chars["h"],
+                self._box_chars["rt"],
+                self._box_chars["cross"]
+            )
             
             if self.show_header:
-                headers = [col["header"] for col in self.columns]
+                headers = [col.header for col in self.columns]
+                header_widths = [col.header_width for col in self.columns]
                 header_styles = [self.header_style] * len(self.columns)
-                lines.append(self._render_row(headers, header_styles))
-                
-                lines.append(self._render_border(
-                    self._box_chars["lt"],
-                    self._box_chars["h"],
-                    self._box_chars["rt"],
-                    self._box_chars["cross"]
-                ))
+                yield self._render_row(headers, header_widths, header_styles)
+                yield separator
             
-            for idx, row in enumerate(self.rows):
-                lines.append(self._render_row(row["cells"], row_style=row["style"]))
-                
-                if self.show_lines and idx < len(self.rows) - 1:
-                    lines.append(self._render_border(
-                        self._box_chars["lt"],
-                        self._box_chars["h"],
-                        self._box_chars["rt"],
-                        self._box_chars["cross"]
-                    ))
-            
-            lines.append(self._render_border(
+            first = True
+            for cells, cell_widths, row_style in measured:
+                if self.show_lines and not first:
+                    yield separator
+                first = False
+                yield self._render_row(cells, cell_widths, row_style=row_style)
+            
+            yield self._render_border(
                 self._box_chars["bl"],
                 self._box_chars["h"],
                 self._box_chars["br"],
                 self._box_chars["bt"]
-            ))
+            )
             
             if self.caption:
                 caption_text = self.caption
                 if self.caption_style:
                     caption_text = self._apply_style(caption_text, self.caption_style)
-                lines.append(caption_text)
+                yield caption_text
+        
+        def freeze_widths(self, widths: Optional[List[int]] = None,
+                          sample: Optional[int] = None) -> List[int]:
+            """Fix the column widths used by later renders, e.g. while scrolling.
+            
+            Args:
+                widths: Widths to use. If None, they are computed from the table.
+                sample: Estimate widths from about this many rows spread evenly
+                       over the table instead of from every row. Wider cells
+                       are truncated by the column's overflow setting.
+                       
+            Returns:
+                The frozen column widths
+                
+            Example:
+                >>> table.freeze_widths(sample=1000)
+                >>> print(table.viewport(5000, 5040))
+            """
+            if widths is None:
+                content_widths = None
+                n_rows = len(self.rows)
+                if sample and n_rows > sample:
+                    step = n_rows / sample
+                    indices = [int(i * step) for i in range(sample)]
+                    if self._columnar:
+                        content_widths = [max(map(col.widths.__getitem__, indices)) for col in self.columns]
+                    else:
+                        picked = [self.rows[i]["widths"] for i in indices]
+                        content_widths = [max(column) for column in zip(*picked)]
+                self._calculate_widths(content_widths=content_widths)
+                widths = [col.actual_width for col in self.columns]
+            elif len(widths) != len(self.columns):
+                raise ValueError(f"Expected {len(self.columns)} widths, got {len(widths)}")
+            
+            self._frozen_widths = list(widths)
+            return list(widths)
+        
+        def unfreeze_widths(self):
+            """Go back to computing column widths on every render."""
+            self._frozen_widths = None
+        
+        def viewport(self, start: int, stop: int, widths: Optional[List[int]] = None) -> str:
+            """Render only table rows [start:stop] with the table's borders and header.
+            
+            The cost depends on the window size, not the number of rows. Column
+            widths come from widths, freeze_widths() or the running column maxima,
+            so they stay stable while scrolling when frozen.
+            
+            Args:
+                start: First row to render
+                stop: Row to stop before
+                widths: Fixed column widths for this render
+                
+            Returns:
+                Rendered window as a string
+                
+            Example:
+                >>> table.freeze_widths()
+                >>> for top in range(0, len(table.rows), 40):
+                ...     print(table.viewport(top, top + 40))
+            """
+            return "\n".join(self.iter_lines(widths=widths, start=start, stop=stop))
+        
+        def _live_row_line(self, row_idx: int) -> str:
+            """Return the rendered line of a stored row, re-rendering it only if it changed."""
+            line = self._row_lines.get(row_idx)
+            if line is None or row_idx in self._dirty:
+                cells, widths, style = self._row_at(row_idx)
+                line = self._render_row(cells, widths, row_style=style)
+                self._row_lines[row_idx] = line
+                self._dirty.discard(row_idx)
+            return line
+        
+        def _live_frame(self) -> Dict[str, str]:
+            """Return the title, border, header and caption lines for the current widths."""
+            frame = self._frame_lines
+            if not frame:
+                box = self._box_chars
+                if self.title:
+                    frame["title"] = self._apply_style(self.title, self.title_style) if self.title_style else self.title
+                frame["top"] = self._render_border(box["tl"], box["h"], box["tr"], box["tt"])
+                frame["separator"] = self._render_border(box["lt"], box["h"], box["rt"], box["cross"])
+                frame["bottom"] = self._render_border(box["bl"], box["h"], box["br"], box["bt"])
+                if self.show_header:
+                    frame["header"] = self._render_row(
+                        [col.header for col in self.columns],
+                        [col.header_width for col in self.columns],
+                        [self.header_style] * len(self.columns)
+                    )
+                if self.caption:
+                    frame["caption"] = (self._apply_style(self.caption, self.caption_style)
+                                        if self.caption_style else self.caption)
+            return frame
+        
+        def _live_row_block(self, start: int, stop: int) -> List[str]:
+            """Return the lines of rows [start:stop], with separators when show_lines is set."""
+            lines = []
+            separator = self._frame_lines["separator"]
+            for row_idx in range(start, stop):
+                if self.show_lines and row_idx:
+                    lines.append(separator)
+                lines.append(self._live_row_line(row_idx))
+            return lines
+        
+        def refresh(self, file=None):
+            """Draw a live table, or update it in place on the terminal.
+            
+            The first call prints the whole table. Later calls move the cursor
+            back up and rewrite only the lines of rows changed by update_cell(),
+            plus any rows added since, in a single write. The whole table is
+            repainted when column widths or styles change. Without ANSI support
+            the full table is printed again.
+            
+            Args:
+                file: Terminal stream (defaults to sys.stdout)
+                
+            Example:
+                >>> board = vg.Table(live=True)
+                >>> board.add_column("Service")
+                >>> board.add_column("Status")
+                >>> board.add_row("api", "OK")
+                >>> board.refresh()
+                >>> board.update_cell(0, 1, "DOWN")
+                >>> board.refresh()  # rewrites one line
+            """
+            if not self.live:
+                raise ValueError("refresh() requires a table created with live=True")
+            file = file or sys.stdout
+            if not self.columns:
+                return
+            if not self.vg._enabled:
+                file.write(str(self) + "\n")
+                file.flush()
+                return
+            
+            if self._frozen_widths is None:
+                self._calculate_widths()
+            else:
+                for col, width in zip(self.columns, self._frozen_widths):
+                    col.actual_width = width
+            key = (tuple(col.actual_width for col in self.columns), len(self.columns),
+                   self.vg._registry.version)
+            full = key != self._live_key
+            if full:
+                self._live_key = key
+                self._row_lines = {}
+                self._frame_lines = {}
+                self._dirty.clear()
+            
+            frame = self._live_frame()
+            head = [frame[name] for name in ("title", "top") if name in frame]
+            if self.show_header:
+                head += [frame["header"], frame["separator"]]
+            tail = [frame[name] for name in ("bottom", "caption") if name in frame]
+            step = 2 if self.show_lines else 1
+            n_rows = len(self.rows)
+            
+            def block_start(row_idx):
+                # Line where row_idx's separator (if any) and row begin, from the table top
+                index = len(head) + row_idx * step
+                return index - 1 if self.show_lines and row_idx else index
             
-            return "\n".join(lines)
+            total = block_start(n_rows) + len(tail)
+            
+            out = []
+            painted = self._painted_lines
+            if full or painted is None or n_rows < self._painted_rows:
+                if painted:
+                    out.append(f"\x1b[{painted}F")
+                for line in head + self._live_row_block(0, n_rows) + tail:
+                    out.append("\x1b[2K" + line + "\n")
+                if painted:
+                    out.append("\x1b[J")
+            else:
+                cursor = painted
+                
+                def move(target):
+                    if target < cursor:
+                        out.append(f"\x1b[{cursor - target}F")
+                    elif target > cursor:
+                        out.append(f"\x1b[{target - cursor}E")
+                    return target
+                
+                old_rows = self._painted_rows
+                for row_idx in sorted(i for i in self._dirty if i < old_rows):
+                    cursor = move(len(head) + row_idx * step)
+                    out.append("\x1b[2K" + self._live_row_line(row_idx))
+                if n_rows > old_rows:
+                    cursor = move(block_start(old_rows))
+                    for line in self._live_row_block(old_rows, n_rows) + tail:
+                        out.append("\x1b[2K" + line + "\n")
+                else:
+                    move(total)
+            
+            self._dirty.clear()
+            self._painted_rows = n_rows
+            self._painted_lines = total
+            if out:
+                file.write("".join(out))
+                file.flush()
+        
+        def _export_shell(self) -> 'Vargula._Table':
+            """Return a copy of the table's settings and column widths without any rows."""
+            shell = copy.copy(self)
+            shell.columns = []
+            for col in self.columns:
+                col = copy.copy(col)
+                col.cells = None
+                col.widths = None
+                col.width_counts = {}
+                shell.columns.append(col)
+            shell.rows = []
+            shell._columnar = False
+            shell.live = False
+            shell._row_lines = {}
+            shell._frame_lines = {}
+            shell._dirty = set()
+            for name in ("_row_count", "_row_styles", "_style_names", "_style_ids"):
+                shell.__dict__.pop(name, None)
+            return shell
+        
+        def write_parallel(self, fp, workers: Optional[int] = None, chunk_rows: int = 20000,
+                           widths: Optional[List[int]] = None) -> int:
+            """Render the table's rows in a process pool and write them to fp in order.
+            
+            Column widths are fixed first; then chunks of rows are rendered by
+            worker processes, each holding a row-less copy of the table, while
+            this process writes finished chunks in order. At most two chunks
+            per worker are in flight. The output is identical to write_to().
+            
+            Args:
+                fp: Text file object with a write() method
+                workers: Number of worker processes (defaults to the CPU count)
+                chunk_rows: Rows rendered per task
+                widths: Fixed column widths, as in iter_lines()
+                
+            Returns:
+                Number of lines written
+                
+            Example:
+                >>> with open("report.txt", "w") as f:
+                ...     table.write_parallel(f, workers=32)
+            """
+            from concurrent.futures import ProcessPoolExecutor
+            
+            if not self.columns:
+                return 0
+            
+            # Rendering the frame alone fixes the column widths for the workers
+            frame = list(self.iter_lines(rows=(), widths=widths))
+            n_head = (1 if self.title else 0) + 1 + (2 if self.show_header else 0)
+            head, tail = frame[:n_head], frame[n_head:]
+            between = ""
+            joiner = "\n"
+            if self.show_lines:
+                separator = self._render_border(
+                    self._box_chars["lt"],
+                    self._box_chars["h"],
+                    self._box_chars["rt"],
+                    self._box_chars["cross"]
+                )
+                between = separator + "\n"
+                joiner = "\n" + between
+            
+            n_rows = len(self.rows)
+            fp.write("\n".join(head) + "\n")
+            
+            workers = workers or os.cpu_count() or 1
+            first = True
+            with ProcessPoolExecutor(max_workers=workers, initializer=_export_init,
+                                     initargs=(self._export_shell(), joiner)) as pool:
+                pending = deque()
+                for start in range(0, n_rows, chunk_rows):
+                    chunk = list(self._iter_rows(None, start, start + chunk_rows))
+                    pending.append(pool.submit(_export_chunk, chunk))
+                    while len(pending) >= 2 * workers or (pending and pending[0].done()):
+                        fp.write(("" if first else between) + pending.popleft().result() + "\n")
+                        first = False
+                while pending:
+                    fp.write(("" if first else between) + pending.popleft().result() + "\n")
+                    first = False
+            
+            fp.write("\n".join(tail) + "\n")
+            row_lines = 2 * n_rows - 1 if self.show_lines and n_rows else n_rows
+            return len(frame) + row_lines
+        
+        def write_to(self, fp, chunk_size: int = 65536, rows=None,
+                     widths: Optional[List[int]] = None) -> int:
+            """Stream the rendered table to a file object in chunks.
+            
+            Lines are rendered lazily and written in batches of about chunk_size
+            characters, each followed by a newline.
+            
+            Args:
+                fp: Text file object with a write() method
+                chunk_size: Characters to buffer before each write()
+                rows: Rows to render instead of the table's own, as in iter_lines()
+                widths: Fixed column widths, as in iter_lines()
+                
+            Returns:
+                Number of lines written
+                
+            Example:
+                >>> with open("report.txt", "w") as f:
+                ...     table.write_to(f)
+            """
+            buffer = []
+            size = 0
+            count = 0
+            for line in self.iter_lines(rows=rows, widths=widths):
+                buffer.append(line)
+                size += len(line) + 1
+                count += 1
+                if size >= chunk_size:
+                    buffer.append("")
+                    fp.write("\n".join(buffer))
+                    buffer = []
+                    size = 0
+            if buffer:
+                buffer.append("")
+                fp.write("\n".join(buffer))
+            return count
+        
+        def __str__(self) -> str:
+            """Render the table as a string."""
+            return "\n".join(self.iter_lines())
     
     # ============================================
     # _ProgressBar Class (Inner - Private)
@@ -1628,7 +3608,9 @@ class Vargula:
             show_rate: bool = True,
             show_eta: bool = True,
             bar_format: str = None,
-            refresh_rate: float = 0.1
+            refresh_rate: float = 0.1,
+            miniters: int = None,
+            maxinterval: float = 10.0
         ):
             """Initialize a progress bar."""
             self.vg = vargula
@@ -1647,6 +3629,15 @@ class Vargula:
             self.bar_format = bar_format
             self.refresh_rate = refresh_rate
             
+            # update() only calls _tick() once current reaches _next_check;
+            # with adaptive miniters that is about once per refresh_rate
+            self.miniters = miniters or 1
+            self.maxinterval = maxinterval
+            self._adaptive_miniters = miniters is None
+            self._next_check = 0
+            self._last_print_n = 0
+            self._rate = None
+            
             self.current = 0
             self.start_time = None
             self.last_update_time = 0
@@ -1687,15 +3678,7 @@ class Vargula:
         
         def _apply_style(self, text: str, style_str: str) -> str:
             """Apply a style string to text."""
-            if not style_str:
-                return text
-            
-            styles = style_str.strip().split()
-            result = text
-            for s in reversed(styles):
-                result = f"<{s}>{result}</{s}>"
-            
-            return self.vg.format(result)
+            return self.vg._apply_style(text, style_str)
         
         def _render(self) -> str:
             """Render the complete progress line."""
@@ -1720,13 +3703,13 @@ class Vargula:
                 parts.append(f"{self.current}/{self.total} {self.unit}")
             
             if self.show_rate and self.start_time:
-                elapsed = time.time() - self.start_time
+                elapsed = time.monotonic() - self.start_time
                 if elapsed > 0:
                     rate = self.current / elapsed
                     parts.append(f"[{rate:.2f} {self.unit}/s]")
             
             if self.show_eta and self.start_time and self.current > 0:
-                elapsed = time.time() - self.start_time
+                elapsed = time.monotonic() - self.start_time
                 rate = self.current / elapsed if elapsed > 0 else 0
                 if rate > 0:
                     remaining = (self.total - self.current) / rate
@@ -1735,16 +3718,53 @@ class Vargula:
             return " ".join(parts)
         
         def update(self, n: int = 1):
-            """Update progress by n steps."""
-            if self.start_time is None:
-                self.start_time = time.time()
+            """Update progress by n steps.
+            
+            Between clock checks this is one addition and one comparison.
+            """
+            self.current += n
+            if self.current >= self._next_check:
+                self._tick()
+        
+        # Weight of the newest rate sample in the adaptive miniters estimate
+        _SMOOTHING = 0.3
+        
+        def _tick(self):
+            """Read the clock, redraw if refresh_rate has passed and schedule the next check."""
+            if self.current > self.total:
+                self.current = self.total
             
-            self.current = min(self.current + n, self.total)
+            now = time.monotonic()
+            if self.start_time is None:
+                self.start_time = now
+                if self._adaptive_miniters and self.maxinterval:
+                    _ProgressMonitor.register(self)
             
-            current_time = time.time()
-            if current_time - self.last_update_time >= self.refresh_rate or self.current == self.total:
+            elapsed = now - self.last_update_time
+            if elapsed >= self.refresh_rate or self.current >= self.total:
+                if self._adaptive_miniters and self.last_update_time:
+                    self._tune_miniters((self.current - self._last_print_n) / elapsed)
                 self._display()
-                self.last_update_time = current_time
+                self.last_update_time = now
+                self._last_print_n = self.current
+                self._next_check = self.current + self.miniters
+            else:
+                self._next_check = max(self._last_print_n + self.miniters, self.current + 1)
+            if self._next_check > self.total:
+                self._next_check = self.total
+        
+        def _tune_miniters(self, rate: float):
+            """Set miniters to the steps expected in one refresh_rate at the observed rate.
+            
+            The rate is smoothed with an exponential moving average, as in
+            tqdm. miniters grows at most 2x per redraw and never past twice
+            the latest sample, so it drops right away when the loop slows.
+            """
+            smoothed = rate if self._rate is None else (
+                self._SMOOTHING * rate + (1 - self._SMOOTHING) * self._rate)
+            self._rate = smoothed
+            target = min(smoothed, 2 * rate) * self.refresh_rate
+            self.miniters = max(1, min(int(target), 2 * self.miniters))
         
         def _display(self):
             """Display the progress bar."""
@@ -1757,12 +3777,14 @@ class Vargula:
             if self.current >= self.total and not self._finished:
                 print()
                 self._finished = True
+                _ProgressMonitor.unregister(self)
         
         def close(self):
             """Finish the progress bar."""
             if not self._finished:
                 self.current = self.total
                 self._display()
+            _ProgressMonitor.unregister(self)
         
         def __enter__(self):
             """Context manager entry."""
@@ -1827,6 +3849,329 @@ class Vargula:
             """Context manager exit."""
             for task in self.tasks.values():
                 task["progress"].close()
+    
+    # ============================================
+    # _Console Class (Inner - Private)
+    # ============================================
+    
+    class _Console:
+        """Buffered writer that formats into memory and flushes in batches.
+        
+        Access via vg.Console() factory method.
+        """
+        
+        def __init__(
+            self,
+            vargula: 'Vargula',
+            file=None,
+            buffer_size: int = 65536,
+            max_lines: int = None,
+            flush_interval: float = None
+        ):
+            """Initialize a console.
+            
+            Args:
+                vargula: Instance used to format markup
+                file: Stream to write to; defaults to sys.stdout at flush time
+                buffer_size: Flush once this many characters are buffered
+                max_lines: Flush once this many lines are buffered
+                flush_interval: Flush on the next write once this many seconds
+                    have passed since the last flush. There is no timer: output
+                    written just before the console goes idle stays buffered
+                    until the next write, flush(), close() or exit.
+            """
+            self.vg = vargula
+            self.file = file
+            self.buffer_size = buffer_size
+            self.max_lines = max_lines
+            self.flush_interval = flush_interval
+            
+            self._buffer = []
+            self._size = 0
+            self._lines = 0
+            self._last_flush = time.monotonic()
+            
+            # Reads the instance dict, not the instance, so it doesn't keep it alive
+            self._finalizer = weakref.finalize(self, self._flush_state, self.__dict__)
+        
+        @staticmethod
+        def _flush_state(state: Dict):
+            """Write out a collected or exiting console's buffer."""
+            if state["_buffer"]:
+                file = sys.stdout if state["file"] is None else state["file"]
+                file.write("".join(state["_buffer"]))
+                file.flush()
+                state["_buffer"] = []
+        
+        def write(self, *args, sep: str = " ", end: str = "\n"):
+            """Format values like Vargula.write() and buffer the result."""
+            fmt = self.vg.format
+            text = sep.join([fmt(str(arg)) for arg in args]) + end
+            self._buffer.append(text)
+            self._size += len(text)
+            if end:
+                self._lines += 1
+            self._check_flush()
+        
+        def writelines(self, lines, end: str = "\n"):
+            """Format and buffer each item of an iterable as its own line."""
+            fmt = self.vg.format
+            buffer = self._buffer
+            for line in lines:
+                text = fmt(str(line)) + end
+                buffer.append(text)
+                self._size += len(text)
+                self._lines += 1
+                if (self._size >= self.buffer_size
+                        or (self.max_lines is not None and self._lines >= self.max_lines)):
+                    self.flush()
+                    buffer = self._buffer
+            self._check_flush()
+        
+        def _check_flush(self):
+            """Flush when a size, line or time threshold has been reached."""
+            if self._size >= self.buffer_size:
+                self.flush()
+            elif self.max_lines is not None and self._lines >= self.max_lines:
+                self.flush()
+            elif (self.flush_interval is not None
+                  and time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+        
+        def flush(self):
+            """Write all buffered output to the stream in one call."""
+            if self._buffer:
+                file = sys.stdout if self.file is None else self.file
+                file.write("".join(self._buffer))
+                file.flush()
+                self._buffer = []
+                self._size = 0
+                self._lines = 0
+            self._last_flush = time.monotonic()
+        
+        def close(self):
+            """Flush any remaining output."""
+            self.flush()
+        
+        def __enter__(self):
+            """Context manager entry."""
+            return self
+        
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            """Context manager exit."""
+            self.close()
+    
+    # ============================================
+    # _AsyncConsole Class (Inner - Private)
+    # ============================================
+    
+    class _AsyncConsole:
+        """asyncio writer that buffers formatted output and flushes it asynchronously.
+        
+        Access via vg.AsyncConsole() factory method.
+        """
+        
+        def __init__(
+            self,
+            vargula: 'Vargula',
+            writer=None,
+            file=None,
+            high_water: int = 65536,
+            offload_threshold: int = None,
+            encoding: str = "utf-8"
+        ):
+            """Initialize an async console.
+            
+            Args:
+                vargula: Instance used to format markup
+                writer: asyncio.StreamWriter or write transport to send output to.
+                    If None, output goes to file through a worker thread.
+                file: Stream used when writer is None; defaults to sys.stdout
+                high_water: Buffered bytes that trigger a flush and, for
+                    awrite(), make the caller wait for the flush. Flushes to a
+                    transport without drain() also wait until its write buffer
+                    is back under this size.
+                offload_threshold: Format payloads of at least this many
+                    characters in a worker thread (awrite() only)
+                encoding: Output encoding
+            """
+            self.vg = vargula
+            self.writer = writer
+            self.file = file
+            self.high_water = high_water
+            self.offload_threshold = offload_threshold
+            self.encoding = encoding
+            
+            self._buffer = bytearray()
+            self._flush_task = None
+        
+        def _encode(self, args, sep: str, end: str) -> bytearray:
+            """Format and encode values like Vargula.write()."""
+            data = bytearray()
+            encoding = self.encoding
+            sep_bytes = sep.encode(encoding)
+            for i, arg in enumerate(args):
+                if i:
+                    data += sep_bytes
+                self.vg.format_into(data, str(arg), encoding)
+            data += end.encode(encoding)
+            return data
+        
+        def write(self, *args, sep: str = " ", end: str = "\n"):
+            """Queue formatted output without blocking.
+            
+            A flush is scheduled on the running loop once high_water bytes
+            are buffered; use awrite() to also wait for it.
+            """
+            self._buffer += self._encode(args, sep, end)
+            if len(self._buffer) >= self.high_water:
+                self._schedule_flush()
+        
+        async def awrite(self, *args, sep: str = " ", end: str = "\n"):
+            """Queue formatted output, waiting for a flush past high_water."""
+            threshold = self.offload_threshold
+            if threshold is not None and sum(len(str(arg)) for arg in args) >= threshold:
+                import asyncio
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(None, self._encode, args, sep, end)
+            else:
+                data = self._encode(args, sep, end)
+            self._buffer += data
+            if len(self._buffer) >= self.high_water:
+                await self.drain()
+        
+        def _schedule_flush(self):
+            """Start a background flush if none is running.
+            
+            A failed flush task is kept, not replaced, so that drain() can
+            raise its error.
+            """
+            task = self._flush_task
+            if task is not None and (not task.done() or task.cancelled() or task.exception() is not None):
+                return
+            import asyncio
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._flush_task = loop.create_task(self._flush())
+        
+        def _reap_flush(self):
+            """Forget a finished flush task, re-raising its error if it failed."""
+            task = self._flush_task
+            if task is not None and task.done():
+                self._flush_task = None
+                task.result()
+        
+        async def _flush(self):
+            """Hand buffered bytes to the writer until the buffer is empty."""
+            while self._buffer:
+                data = self._buffer
+                self._buffer = bytearray()
+                if self.writer is not None:
+                    self.writer.write(data)
+                    drain = getattr(self.writer, "drain", None)
+                    if drain is not None:
+                        await drain()
+                    else:
+                        await self._wait_transport()
+                else:
+                    import asyncio
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, self._write_file, data)
+        
+        async def _wait_transport(self):
+            """Wait until a raw transport's write buffer is back under high_water.
+            
+            Transports report pause_writing() to their own protocol, not to us,
+            so the buffer size is polled with a growing delay.
+            """
+            get_size = getattr(self.writer, "get_write_buffer_size", None)
+            if get_size is None:
+                return
+            import asyncio
+            delay = 0.001
+            while get_size() > self.high_water and not self.writer.is_closing():
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        
+        def _write_file(self, data: bytearray):
+            """Blocking write of encoded output to the file (runs in a worker thread)."""
+            file = sys.stdout if self.file is None else self.file
+            binary = getattr(file, "buffer", None)
+            if binary is not None:
+                file.flush()
+                binary.write(data)
+                binary.flush()
+            else:
+                file.write(data.decode(self.encoding))
+                file.flush()
+        
+        async def drain(self):
+            """Wait until all queued output has been handed to the writer.
+            
+            Raises the error of a failed flush.
+            """
+            import asyncio
+            while True:
+                task = self._flush_task
+                if task is not None and not task.done():
+                    await asyncio.wait((task,))
+                self._reap_flush()
+                if not self._buffer:
+                    return
+                self._schedule_flush()
+        
+        async def aclose(self):
+            """Flush any remaining output."""
+            await self.drain()
+        
+        async def __aenter__(self):
+            """Async context manager entry."""
+            return self
+        
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            """Async context manager exit."""
+            await self.aclose()
+
+
+class NullVargula(Vargula):
+    """Vargula instance that never emits ANSI codes.
+    
+    Styling calls are reduced to the cheapest possible pass-through: style()
+    returns its text unchanged, format() only strips markup tags, and tables
+    and progress bars skip all style processing. Intended for runs where
+    colors are always off, such as CI logs or NO_COLOR environments.
+    
+    Example:
+        >>> vg = NullVargula()
+        >>> vg.style("Error", color="red")
+        'Error'
+        >>> vg.format("<red>Error</red>")
+        'Error'
+    """
+    
+    def __init__(self):
+        """Initialize a permanently disabled instance."""
+        super().__init__(enabled=False, format_cache_size=0)
+    
+    def enable(self):
+        """Ignored: a NullVargula never enables styling."""
+    
+    def style(self, text: str, color=None, bg=None, look=None) -> str:
+        """Return text unchanged."""
+        return text
+    
+    def format(self, text: str) -> str:
+        """Return text with markup tags removed."""
+        if '<' not in text:
+            return text
+        return _STRIP_TAGS.sub('', text)
+    
+    def write(self, *args, sep=" ", end="\n", file=None, flush=False):
+        """Print text with markup tags removed (works like built-in print())."""
+        print(sep.join([self.format(str(arg)) for arg in args]), end=end,
+              file=sys.stdout if file is None else file, flush=flush)
 
 
 # ============================================
@@ -1836,6 +4181,7 @@ class Vargula:
 __all__ = [
     # Main class
     "Vargula",
+    "NullVargula",
     
     # Type definitions
     "PaletteScheme",
@@ -1845,6 +4191,7 @@ __all__ = [
     "COLORS",
     "BG_COLORS",
     "LOOKS",
+    "COLOR_DEPTHS",
     
     # Helper function
     "progress_bar",